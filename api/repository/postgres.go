@@ -0,0 +1,107 @@
+package repository
+
+import (
+	"database/sql"
+	"fmt"
+	"regexp"
+	"strings"
+
+	_ "github.com/lib/pq" // PostgreSQL driver
+
+	conf "github.com/kazemisoroush/code-refactoring-tool/pkg/config"
+)
+
+// postgresIdentifierRegex matches unquoted identifiers usable as table names. PostgreSQL truncates
+// identifiers at 63 bytes, and index names are derived as idx_<table>_<columns> with suffixes of up
+// to 15 bytes (_project_status), so table names are capped at 63-4-15 = 44 bytes.
+var postgresIdentifierRegex = regexp.MustCompile(`^[A-Za-z_][A-Za-z0-9_]{0,43}$`)
+
+// PostgresConfig holds configuration for PostgreSQL connection
+type PostgresConfig struct {
+	Host                  string
+	Port                  int
+	Database              string
+	Username              string
+	Password              string
+	SSLMode               string
+	ConnectTimeoutSeconds int // Defaults to conf.DefaultPostgresConnectTimeoutSeconds when zero
+	MaxOpenConns          int // Defaults to conf.DefaultPostgresMaxOpenConns when zero
+	MaxIdleConns          int // Defaults to conf.DefaultPostgresMaxIdleConns when zero
+}
+
+// withDefaults returns a copy of the config with unset connection and pool settings filled in
+func (c PostgresConfig) withDefaults() PostgresConfig {
+	if c.ConnectTimeoutSeconds <= 0 {
+		// connect_timeout=0 would make lib/pq wait forever
+		c.ConnectTimeoutSeconds = conf.DefaultPostgresConnectTimeoutSeconds
+	}
+	if c.MaxOpenConns <= 0 {
+		c.MaxOpenConns = conf.DefaultPostgresMaxOpenConns
+	}
+	if c.MaxIdleConns <= 0 {
+		c.MaxIdleConns = conf.DefaultPostgresMaxIdleConns
+	}
+	return c
+}
+
+// dsn builds the lib/pq connection string for the config
+func (c PostgresConfig) dsn() string {
+	return fmt.Sprintf("host=%s port=%d user=%s password=%s dbname=%s sslmode=%s connect_timeout=%d",
+		c.Host, c.Port, c.Username, c.Password, c.Database, c.SSLMode, c.ConnectTimeoutSeconds)
+}
+
+// OpenPostgresDB opens a PostgreSQL connection pool, sizes it and verifies it is reachable.
+// The pool is meant to be shared by all PostgreSQL repositories.
+func OpenPostgresDB(config PostgresConfig) (*sql.DB, error) {
+	config = config.withDefaults()
+
+	db, err := sql.Open("postgres", config.dsn())
+	if err != nil {
+		return nil, fmt.Errorf("failed to open PostgreSQL connection: %w", err)
+	}
+
+	// Keep warm connections around between requests instead of reconnecting
+	db.SetMaxOpenConns(config.MaxOpenConns)
+	db.SetMaxIdleConns(config.MaxIdleConns)
+	db.SetConnMaxIdleTime(conf.DefaultPostgresConnMaxIdleTime)
+	db.SetConnMaxLifetime(conf.DefaultPostgresConnMaxLifetime)
+
+	// Test the connection
+	if err := db.Ping(); err != nil {
+		_ = db.Close()
+		return nil, fmt.Errorf("failed to ping PostgreSQL database: %w", err)
+	}
+
+	return db, nil
+}
+
+// postgresReservedKeywords lists the PostgreSQL keywords that cannot be used as unquoted table names
+var postgresReservedKeywords = map[string]struct{}{
+	"all": {}, "analyse": {}, "analyze": {}, "and": {}, "any": {}, "array": {}, "as": {}, "asc": {},
+	"asymmetric": {}, "authorization": {}, "binary": {}, "both": {}, "case": {}, "cast": {}, "check": {},
+	"collate": {}, "collation": {}, "column": {}, "concurrently": {}, "constraint": {}, "create": {},
+	"cross": {}, "current_catalog": {}, "current_date": {}, "current_role": {}, "current_schema": {},
+	"current_time": {}, "current_timestamp": {}, "current_user": {}, "default": {}, "deferrable": {},
+	"desc": {}, "distinct": {}, "do": {}, "else": {}, "end": {}, "except": {}, "false": {}, "fetch": {},
+	"for": {}, "foreign": {}, "freeze": {}, "from": {}, "full": {}, "grant": {}, "group": {}, "having": {},
+	"ilike": {}, "in": {}, "initially": {}, "inner": {}, "intersect": {}, "into": {}, "is": {}, "isnull": {},
+	"join": {}, "lateral": {}, "leading": {}, "left": {}, "like": {}, "limit": {}, "localtime": {},
+	"localtimestamp": {}, "natural": {}, "not": {}, "notnull": {}, "null": {}, "offset": {}, "on": {},
+	"only": {}, "or": {}, "order": {}, "outer": {}, "overlaps": {}, "placing": {}, "primary": {},
+	"references": {}, "returning": {}, "right": {}, "select": {}, "session_user": {}, "similar": {},
+	"some": {}, "symmetric": {}, "system_user": {}, "table": {}, "tablesample": {}, "then": {}, "to": {},
+	"trailing": {}, "true": {}, "union": {}, "unique": {}, "user": {}, "using": {}, "variadic": {},
+	"verbose": {}, "when": {}, "where": {}, "window": {}, "with": {},
+}
+
+// validateTableName rejects table names that are not plain identifiers, since they are
+// formatted directly into SQL statements unquoted
+func validateTableName(tableName string) error {
+	if !postgresIdentifierRegex.MatchString(tableName) {
+		return fmt.Errorf("invalid table name %q", tableName)
+	}
+	if _, reserved := postgresReservedKeywords[strings.ToLower(tableName)]; reserved {
+		return fmt.Errorf("invalid table name %q: reserved PostgreSQL keyword", tableName)
+	}
+	return nil
+}
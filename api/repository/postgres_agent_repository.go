@@ -5,7 +5,7 @@ import (
 	"context"
 	"database/sql"
 	"fmt"
-	"log"
+	"log/slog"
 	"time"
 
 	"github.com/lib/pq"
@@ -14,41 +14,20 @@ import (
 	conf "github.com/kazemisoroush/code-refactoring-tool/pkg/config"
 )
 
-// PostgresConfig holds configuration for PostgreSQL connection
-type PostgresConfig struct {
-	Host     string
-	Port     int
-	Database string
-	Username string
-	Password string
-	SSLMode  string
-}
-
 // PostgresAgentRepository implements AgentRepository using PostgreSQL
 type PostgresAgentRepository struct {
 	db        *sql.DB
 	tableName string
 }
 
-// NewPostgresAgentRepository creates a new PostgreSQL agent repository
-func NewPostgresAgentRepository(config PostgresConfig, tableName string) (AgentRepository, error) {
+// NewPostgresAgentRepository creates a new PostgreSQL agent repository on the given connection pool
+// and ensures its table exists
+func NewPostgresAgentRepository(db *sql.DB, tableName string) (AgentRepository, error) {
 	if tableName == "" {
 		tableName = conf.DefaultAgentsTableName
 	}
-
-	// Build connection string
-	connStr := fmt.Sprintf("host=%s port=%d user=%s password=%s dbname=%s sslmode=%s",
-		config.Host, config.Port, config.Username, config.Password, config.Database, config.SSLMode)
-
-	db, err := sql.Open("postgres", connStr)
-	if err != nil {
-		return nil, fmt.Errorf("failed to open PostgreSQL connection: %w", err)
-	}
-
-	// Test the connection
-	if err := db.Ping(); err != nil {
-		_ = db.Close()
-		return nil, fmt.Errorf("failed to ping PostgreSQL database: %w", err)
+	if err := validateTableName(tableName); err != nil {
+		return nil, err
 	}
 
 	repo := &PostgresAgentRepository{
@@ -58,7 +37,6 @@ func NewPostgresAgentRepository(config PostgresConfig, tableName string) (AgentR
 
 	// Create table if it doesn't exist
 	if err := repo.CreateAgentsTable(context.Background()); err != nil {
-		_ = db.Close()
 		return nil, fmt.Errorf("failed to create agents table: %w", err)
 	}
 
@@ -67,22 +45,22 @@ func NewPostgresAgentRepository(config PostgresConfig, tableName string) (AgentR
 
 // NewPostgresAgentRepositoryWithDB creates a new PostgreSQL agent repository with an existing DB connection
 // This is primarily used for testing with mock databases
-func NewPostgresAgentRepositoryWithDB(db *sql.DB, tableName string) AgentRepository {
+func NewPostgresAgentRepositoryWithDB(db *sql.DB, tableName string) (AgentRepository, error) {
 	if tableName == "" {
-		tableName = "agents"
+		tableName = conf.DefaultAgentsTableName
+	}
+	if err := validateTableName(tableName); err != nil {
+		return nil, err
 	}
 
 	return &PostgresAgentRepository{
 		db:        db,
 		tableName: tableName,
-	}
+	}, nil
 }
 
-// Close closes the database connection
+// Close is a no-op: the connection pool is shared between repositories and owned by the caller
 func (r *PostgresAgentRepository) Close() error {
-	if r.db != nil {
-		return r.db.Close()
-	}
 	return nil
 }
 
@@ -240,7 +218,7 @@ func (r *PostgresAgentRepository) ListAgents(ctx context.Context) ([]*AgentRecor
 	}
 	defer func() {
 		if closeErr := rows.Close(); closeErr != nil {
-			log.Printf("Warning: failed to close rows: %v", closeErr)
+			slog.Warn("failed to close rows in ListAgents", "error", closeErr)
 		}
 	}()
 
@@ -308,8 +286,9 @@ func (r *PostgresAgentRepository) UpdateAgentStatus(ctx context.Context, agentID
 
 // CreateAgentsTable creates the agents table if it doesn't exist
 func (r *PostgresAgentRepository) CreateAgentsTable(ctx context.Context) error {
+	// Table and indexes are created in a single round trip
 	query := fmt.Sprintf(`
-		CREATE TABLE IF NOT EXISTS %s (
+		CREATE TABLE IF NOT EXISTS %[1]s (
 			agent_id VARCHAR(255) PRIMARY KEY,
 			agent_version VARCHAR(255) NOT NULL,
 			knowledge_base_id VARCHAR(255) NOT NULL,
@@ -320,7 +299,9 @@ func (r *PostgresAgentRepository) CreateAgentsTable(ctx context.Context) error {
 			status VARCHAR(50) NOT NULL,
 			created_at TIMESTAMP WITH TIME ZONE NOT NULL,
 			updated_at TIMESTAMP WITH TIME ZONE NOT NULL
-		)
+		);
+		CREATE INDEX IF NOT EXISTS idx_%[1]s_status ON %[1]s(status);
+		CREATE INDEX IF NOT EXISTS idx_%[1]s_created_at ON %[1]s(created_at DESC);
 	`, r.tableName)
 
 	_, err := r.db.ExecContext(ctx, query)
@@ -328,25 +309,5 @@ func (r *PostgresAgentRepository) CreateAgentsTable(ctx context.Context) error {
 		return fmt.Errorf("failed to create agents table: %w", err)
 	}
 
-	// Create index on status for efficient filtering
-	indexQuery := fmt.Sprintf(`
-		CREATE INDEX IF NOT EXISTS idx_%s_status ON %s(status)
-	`, r.tableName, r.tableName)
-
-	_, err = r.db.ExecContext(ctx, indexQuery)
-	if err != nil {
-		return fmt.Errorf("failed to create status index: %w", err)
-	}
-
-	// Create index on created_at for efficient sorting
-	timeIndexQuery := fmt.Sprintf(`
-		CREATE INDEX IF NOT EXISTS idx_%s_created_at ON %s(created_at DESC)
-	`, r.tableName, r.tableName)
-
-	_, err = r.db.ExecContext(ctx, timeIndexQuery)
-	if err != nil {
-		return fmt.Errorf("failed to create created_at index: %w", err)
-	}
-
 	return nil
 }
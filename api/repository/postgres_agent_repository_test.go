@@ -3,6 +3,8 @@ package repository
 import (
 	"context"
 	"database/sql"
+	"errors"
+	"strings"
 	"testing"
 	"time"
 
@@ -17,70 +19,70 @@ import (
 func TestNewPostgresAgentRepository(t *testing.T) {
 	tests := []struct {
 		name          string
-		config        PostgresConfig
 		tableName     string
 		expectedTable string
+		createErr     error
 		expectError   bool
 	}{
 		{
-			name: "with valid config and custom table name",
-			config: PostgresConfig{
-				Host:     "localhost",
-				Port:     5432,
-				Database: "testdb",
-				Username: "testuser",
-				Password: "testpass",
-				SSLMode:  "disable",
-			},
+			name:          "with custom table name",
 			tableName:     "custom_agents",
 			expectedTable: "custom_agents",
-			expectError:   true, // Will fail in test environment without real DB
 		},
 		{
-			name: "with valid config and empty table name uses default",
-			config: PostgresConfig{
-				Host:     "localhost",
-				Port:     5432,
-				Database: "testdb",
-				Username: "testuser",
-				Password: "testpass",
-				SSLMode:  "disable",
-			},
+			name:          "with empty table name uses default",
 			tableName:     "",
 			expectedTable: "agents",
-			expectError:   true, // Will fail in test environment without real DB
+		},
+		{
+			name:          "table creation failure",
+			tableName:     "agents",
+			expectedTable: "agents",
+			createErr:     errors.New("permission denied"),
+			expectError:   true,
+		},
+		{
+			name:        "invalid table name",
+			tableName:   "agents; DROP TABLE users",
+			expectError: true,
 		},
 	}
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			repo, err := NewPostgresAgentRepository(tt.config, tt.tableName)
+			db, mock := newMockDB(t)
+
+			if tt.expectedTable != "" {
+				exec := mock.ExpectExec(`CREATE TABLE IF NOT EXISTS ` + tt.expectedTable)
+				if tt.createErr != nil {
+					exec.WillReturnError(tt.createErr)
+				} else {
+					exec.WillReturnResult(sqlmock.NewResult(0, 0))
+				}
+			}
+
+			repo, err := NewPostgresAgentRepository(db, tt.tableName)
 
 			if tt.expectError {
 				assert.Error(t, err)
 				assert.Nil(t, repo)
 			} else {
-				assert.NoError(t, err)
-				assert.NotNil(t, repo)
-				defer func() {
-					if closer, ok := repo.(*PostgresAgentRepository); ok {
-						_ = closer.Close()
-					}
-				}()
+				require.NoError(t, err)
+				assert.Equal(t, tt.expectedTable, repo.(*PostgresAgentRepository).tableName)
 			}
+			assert.NoError(t, mock.ExpectationsWereMet())
 		})
 	}
 }
 
 func TestNewPostgresAgentRepositoryWithDB(t *testing.T) {
-	db, _, err := sqlmock.New()
-	require.NoError(t, err)
-	defer func() { _ = db.Close() }()
+	db, _ := newMockDB(t)
 
 	tests := []struct {
 		name          string
 		tableName     string
 		expectedTable string
+		expectError   bool
 	}{
 		{
 			name:          "with custom table name",
@@ -92,12 +94,33 @@ func TestNewPostgresAgentRepositoryWithDB(t *testing.T) {
 			tableName:     "",
 			expectedTable: "agents",
 		},
+		{
+			name:        "with invalid table name",
+			tableName:   "agents; DROP TABLE agents",
+			expectError: true,
+		},
+		{
+			name:        "with reserved keyword table name",
+			tableName:   "user",
+			expectError: true,
+		},
+		{
+			name:        "with table name too long for derived index names",
+			tableName:   strings.Repeat("a", 45),
+			expectError: true,
+		},
 	}
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			repo := NewPostgresAgentRepositoryWithDB(db, tt.tableName)
+			repo, err := NewPostgresAgentRepositoryWithDB(db, tt.tableName)
+			if tt.expectError {
+				assert.Error(t, err)
+				assert.Nil(t, repo)
+				return
+			}
 
+			require.NoError(t, err)
 			assert.NotNil(t, repo)
 
 			postgresRepo, ok := repo.(*PostgresAgentRepository)
@@ -109,11 +132,9 @@ func TestNewPostgresAgentRepositoryWithDB(t *testing.T) {
 }
 
 func TestPostgresAgentRepository_CreateAgent(t *testing.T) {
-	db, mock, err := sqlmock.New()
-	require.NoError(t, err)
-	defer func() { _ = db.Close() }()
+	db, mock := newMockDB(t)
 
-	repo := NewPostgresAgentRepositoryWithDB(db, "agents")
+	repo := newTestRepository(t, NewPostgresAgentRepositoryWithDB, db, "agents")
 	ctx := context.Background()
 
 	now := time.Now().UTC()
@@ -176,11 +197,9 @@ func TestPostgresAgentRepository_CreateAgent(t *testing.T) {
 }
 
 func TestPostgresAgentRepository_GetAgent(t *testing.T) {
-	db, mock, err := sqlmock.New()
-	require.NoError(t, err)
-	defer func() { _ = db.Close() }()
+	db, mock := newMockDB(t)
 
-	repo := NewPostgresAgentRepositoryWithDB(db, "agents")
+	repo := newTestRepository(t, NewPostgresAgentRepositoryWithDB, db, "agents")
 	ctx := context.Background()
 
 	now := time.Now().UTC()
@@ -244,11 +263,9 @@ func TestPostgresAgentRepository_GetAgent(t *testing.T) {
 }
 
 func TestPostgresAgentRepository_UpdateAgent(t *testing.T) {
-	db, mock, err := sqlmock.New()
-	require.NoError(t, err)
-	defer func() { _ = db.Close() }()
+	db, mock := newMockDB(t)
 
-	repo := NewPostgresAgentRepositoryWithDB(db, "agents")
+	repo := newTestRepository(t, NewPostgresAgentRepositoryWithDB, db, "agents")
 	ctx := context.Background()
 
 	now := time.Now().UTC()
@@ -308,11 +325,9 @@ func TestPostgresAgentRepository_UpdateAgent(t *testing.T) {
 }
 
 func TestPostgresAgentRepository_DeleteAgent(t *testing.T) {
-	db, mock, err := sqlmock.New()
-	require.NoError(t, err)
-	defer func() { _ = db.Close() }()
+	db, mock := newMockDB(t)
 
-	repo := NewPostgresAgentRepositoryWithDB(db, "agents")
+	repo := newTestRepository(t, NewPostgresAgentRepositoryWithDB, db, "agents")
 	ctx := context.Background()
 	agentID := "test-agent-id"
 
@@ -339,11 +354,9 @@ func TestPostgresAgentRepository_DeleteAgent(t *testing.T) {
 }
 
 func TestPostgresAgentRepository_ListAgents(t *testing.T) {
-	db, mock, err := sqlmock.New()
-	require.NoError(t, err)
-	defer func() { _ = db.Close() }()
+	db, mock := newMockDB(t)
 
-	repo := NewPostgresAgentRepositoryWithDB(db, "agents")
+	repo := newTestRepository(t, NewPostgresAgentRepositoryWithDB, db, "agents")
 	ctx := context.Background()
 
 	now := time.Now().UTC()
@@ -391,11 +404,9 @@ func TestPostgresAgentRepository_ListAgents(t *testing.T) {
 }
 
 func TestPostgresAgentRepository_UpdateAgentStatus(t *testing.T) {
-	db, mock, err := sqlmock.New()
-	require.NoError(t, err)
-	defer func() { _ = db.Close() }()
+	db, mock := newMockDB(t)
 
-	repo := NewPostgresAgentRepositoryWithDB(db, "agents")
+	repo := newTestRepository(t, NewPostgresAgentRepositoryWithDB, db, "agents")
 	ctx := context.Background()
 	agentID := "test-agent-id"
 	status := models.AgentStatusFailed
@@ -423,21 +434,18 @@ func TestPostgresAgentRepository_UpdateAgentStatus(t *testing.T) {
 }
 
 func TestPostgresAgentRepository_CreateAgentsTable(t *testing.T) {
-	db, mock, err := sqlmock.New()
-	require.NoError(t, err)
-	defer func() { _ = db.Close() }()
+	db, mock := newMockDB(t)
 
-	repo := NewPostgresAgentRepositoryWithDB(db, "agents").(*PostgresAgentRepository)
+	repo := newTestRepository(t, NewPostgresAgentRepositoryWithDB, db, "agents").(*PostgresAgentRepository)
 	ctx := context.Background()
 
-	mock.ExpectExec(`CREATE TABLE IF NOT EXISTS agents`).
-		WillReturnResult(sqlmock.NewResult(0, 0))
-	mock.ExpectExec(`CREATE INDEX IF NOT EXISTS idx_agents_status`).
-		WillReturnResult(sqlmock.NewResult(0, 0))
-	mock.ExpectExec(`CREATE INDEX IF NOT EXISTS idx_agents_created_at`).
+	// Table and indexes are created in a single round trip
+	mock.ExpectExec(`CREATE TABLE IF NOT EXISTS agents .*` +
+		`CREATE INDEX IF NOT EXISTS idx_agents_status .*` +
+		`CREATE INDEX IF NOT EXISTS idx_agents_created_at`).
 		WillReturnResult(sqlmock.NewResult(0, 0))
 
-	err = repo.CreateAgentsTable(ctx)
+	err := repo.CreateAgentsTable(ctx)
 	assert.NoError(t, err)
 	assert.NoError(t, mock.ExpectationsWereMet())
 }
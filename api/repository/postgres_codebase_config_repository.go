@@ -6,6 +6,7 @@ import (
 	"database/sql"
 	"encoding/json"
 	"fmt"
+	"log/slog"
 	"strings"
 
 	conf "github.com/kazemisoroush/code-refactoring-tool/pkg/config"
@@ -18,24 +19,14 @@ type PostgresCodebaseConfigRepository struct {
 	tableName string
 }
 
-// NewPostgresCodebaseConfigRepository creates a new PostgreSQL codebase configuration repository
-func NewPostgresCodebaseConfigRepository(config PostgresConfig, tableName string) (CodebaseConfigRepository, error) {
+// NewPostgresCodebaseConfigRepository creates a new PostgreSQL codebase configuration repository on the given connection pool
+// and ensures its table exists
+func NewPostgresCodebaseConfigRepository(db *sql.DB, tableName string) (CodebaseConfigRepository, error) {
 	if tableName == "" {
 		tableName = conf.DefaultCodebaseConfigsTableName
 	}
-
-	// Build connection string
-	connStr := fmt.Sprintf("host=%s port=%d user=%s password=%s dbname=%s sslmode=%s",
-		config.Host, config.Port, config.Username, config.Password, config.Database, config.SSLMode)
-
-	db, err := sql.Open("postgres", connStr)
-	if err != nil {
-		return nil, fmt.Errorf("failed to open PostgreSQL connection: %w", err)
-	}
-
-	// Test the connection
-	if err := db.Ping(); err != nil {
-		return nil, fmt.Errorf("failed to ping PostgreSQL database: %w", err)
+	if err := validateTableName(tableName); err != nil {
+		return nil, err
 	}
 
 	repo := &PostgresCodebaseConfigRepository{
@@ -53,22 +44,22 @@ func NewPostgresCodebaseConfigRepository(config PostgresConfig, tableName string
 
 // NewPostgresCodebaseConfigRepositoryWithDB creates a new PostgreSQL codebase configuration repository with an existing DB connection
 // This is primarily used for testing with mock databases
-func NewPostgresCodebaseConfigRepositoryWithDB(db *sql.DB, tableName string) CodebaseConfigRepository {
+func NewPostgresCodebaseConfigRepositoryWithDB(db *sql.DB, tableName string) (CodebaseConfigRepository, error) {
 	if tableName == "" {
-		tableName = "codebase_configs"
+		tableName = conf.DefaultCodebaseConfigsTableName
+	}
+	if err := validateTableName(tableName); err != nil {
+		return nil, err
 	}
 
 	return &PostgresCodebaseConfigRepository{
 		db:        db,
 		tableName: tableName,
-	}
+	}, nil
 }
 
-// Close closes the database connection
+// Close is a no-op: the connection pool is shared between repositories and owned by the caller
 func (r *PostgresCodebaseConfigRepository) Close() error {
-	if r.db != nil {
-		return r.db.Close()
-	}
 	return nil
 }
 
@@ -307,7 +298,7 @@ func (r *PostgresCodebaseConfigRepository) ListCodebaseConfigs(ctx context.Conte
 	}
 	defer func() {
 		if closeErr := rows.Close(); closeErr != nil {
-			fmt.Printf("Error closing rows: %v\n", closeErr)
+			slog.Warn("failed to close rows in ListCodebaseConfigs", "error", closeErr)
 		}
 	}()
 
@@ -366,8 +357,9 @@ func (r *PostgresCodebaseConfigRepository) ListCodebaseConfigs(ctx context.Conte
 
 // CreateTable creates the codebase_configs table if it doesn't exist
 func (r *PostgresCodebaseConfigRepository) CreateTable(ctx context.Context) error {
+	// Table and indexes are created in a single round trip
 	query := fmt.Sprintf(`
-		CREATE TABLE IF NOT EXISTS %s (
+		CREATE TABLE IF NOT EXISTS %[1]s (
 			config_id VARCHAR(255) PRIMARY KEY,
 			name VARCHAR(255) NOT NULL,
 			description TEXT,
@@ -377,7 +369,12 @@ func (r *PostgresCodebaseConfigRepository) CreateTable(ctx context.Context) erro
 			updated_at TIMESTAMP WITH TIME ZONE NOT NULL,
 			tags JSONB DEFAULT '{}',
 			config JSONB NOT NULL
-		)
+		);
+		CREATE INDEX IF NOT EXISTS idx_%[1]s_name ON %[1]s (name);
+		CREATE INDEX IF NOT EXISTS idx_%[1]s_provider ON %[1]s (provider);
+		CREATE INDEX IF NOT EXISTS idx_%[1]s_created_at ON %[1]s (created_at);
+		CREATE INDEX IF NOT EXISTS idx_%[1]s_tags ON %[1]s USING GIN (tags);
+		CREATE INDEX IF NOT EXISTS idx_%[1]s_url ON %[1]s (url);
 	`, r.tableName)
 
 	_, err := r.db.ExecContext(ctx, query)
@@ -385,21 +382,5 @@ func (r *PostgresCodebaseConfigRepository) CreateTable(ctx context.Context) erro
 		return fmt.Errorf("failed to create codebase_configs table: %w", err)
 	}
 
-	// Create indexes for better performance
-	indexes := []string{
-		fmt.Sprintf("CREATE INDEX IF NOT EXISTS idx_%s_name ON %s (name)", r.tableName, r.tableName),
-		fmt.Sprintf("CREATE INDEX IF NOT EXISTS idx_%s_provider ON %s (provider)", r.tableName, r.tableName),
-		fmt.Sprintf("CREATE INDEX IF NOT EXISTS idx_%s_created_at ON %s (created_at)", r.tableName, r.tableName),
-		fmt.Sprintf("CREATE INDEX IF NOT EXISTS idx_%s_tags ON %s USING GIN (tags)", r.tableName, r.tableName),
-		fmt.Sprintf("CREATE INDEX IF NOT EXISTS idx_%s_url ON %s (url)", r.tableName, r.tableName),
-	}
-
-	for _, indexQuery := range indexes {
-		_, err := r.db.ExecContext(ctx, indexQuery)
-		if err != nil {
-			return fmt.Errorf("failed to create index: %w", err)
-		}
-	}
-
 	return nil
 }
@@ -20,25 +20,14 @@ type PostgresCodebaseRepository struct {
 	tableName string
 }
 
-// NewPostgresCodebaseRepository creates a new PostgreSQL codebase repository
-func NewPostgresCodebaseRepository(config PostgresConfig, tableName string) (CodebaseRepository, error) {
+// NewPostgresCodebaseRepository creates a new PostgreSQL codebase repository on the given connection pool
+// and ensures its table exists
+func NewPostgresCodebaseRepository(db *sql.DB, tableName string) (CodebaseRepository, error) {
 	if tableName == "" {
 		tableName = conf.DefaultCodebasesTableName
 	}
-
-	// Build connection string
-	connStr := fmt.Sprintf("host=%s port=%d user=%s password=%s dbname=%s sslmode=%s",
-		config.Host, config.Port, config.Username, config.Password, config.Database, config.SSLMode)
-
-	db, err := sql.Open("postgres", connStr)
-	if err != nil {
-		return nil, fmt.Errorf("failed to open PostgreSQL connection: %w", err)
-	}
-
-	// Test the connection
-	if err := db.Ping(); err != nil {
-		_ = db.Close()
-		return nil, fmt.Errorf("failed to ping PostgreSQL database: %w", err)
+	if err := validateTableName(tableName); err != nil {
+		return nil, err
 	}
 
 	repo := &PostgresCodebaseRepository{
@@ -48,7 +37,6 @@ func NewPostgresCodebaseRepository(config PostgresConfig, tableName string) (Cod
 
 	// Create table if it doesn't exist
 	if err := repo.createTableIfNotExists(); err != nil {
-		_ = db.Close()
 		return nil, fmt.Errorf("failed to create table: %w", err)
 	}
 
@@ -6,6 +6,7 @@ import (
 	"database/sql"
 	"encoding/json"
 	"fmt"
+	"log/slog"
 
 	conf "github.com/kazemisoroush/code-refactoring-tool/pkg/config"
 	"github.com/lib/pq"
@@ -17,25 +18,14 @@ type PostgresProjectRepository struct {
 	tableName string
 }
 
-// NewPostgresProjectRepository creates a new PostgreSQL project repository
-func NewPostgresProjectRepository(config PostgresConfig, tableName string) (ProjectRepository, error) {
+// NewPostgresProjectRepository creates a new PostgreSQL project repository on the given connection pool
+// and ensures its table exists
+func NewPostgresProjectRepository(db *sql.DB, tableName string) (ProjectRepository, error) {
 	if tableName == "" {
 		tableName = conf.DefaultProjectsTableName
 	}
-
-	// Build connection string
-	connStr := fmt.Sprintf("host=%s port=%d user=%s password=%s dbname=%s sslmode=%s",
-		config.Host, config.Port, config.Username, config.Password, config.Database, config.SSLMode)
-
-	db, err := sql.Open("postgres", connStr)
-	if err != nil {
-		return nil, fmt.Errorf("failed to open PostgreSQL connection: %w", err)
-	}
-
-	// Test the connection
-	if err := db.Ping(); err != nil {
-		_ = db.Close()
-		return nil, fmt.Errorf("failed to ping PostgreSQL database: %w", err)
+	if err := validateTableName(tableName); err != nil {
+		return nil, err
 	}
 
 	repo := &PostgresProjectRepository{
@@ -45,7 +35,6 @@ func NewPostgresProjectRepository(config PostgresConfig, tableName string) (Proj
 
 	// Create table if it doesn't exist
 	if err := repo.CreateTable(context.Background()); err != nil {
-		_ = db.Close()
 		return nil, fmt.Errorf("failed to create projects table: %w", err)
 	}
 
@@ -54,22 +43,22 @@ func NewPostgresProjectRepository(config PostgresConfig, tableName string) (Proj
 
 // NewPostgresProjectRepositoryWithDB creates a new PostgreSQL project repository with an existing DB connection
 // This is primarily used for testing with mock databases
-func NewPostgresProjectRepositoryWithDB(db *sql.DB, tableName string) ProjectRepository {
+func NewPostgresProjectRepositoryWithDB(db *sql.DB, tableName string) (ProjectRepository, error) {
 	if tableName == "" {
-		tableName = "projects"
+		tableName = conf.DefaultProjectsTableName
+	}
+	if err := validateTableName(tableName); err != nil {
+		return nil, err
 	}
 
 	return &PostgresProjectRepository{
 		db:        db,
 		tableName: tableName,
-	}
+	}, nil
 }
 
-// Close closes the database connection
+// Close is a no-op: the connection pool is shared between repositories and owned by the caller
 func (r *PostgresProjectRepository) Close() error {
-	if r.db != nil {
-		return r.db.Close()
-	}
 	return nil
 }
 
@@ -312,7 +301,7 @@ func (r *PostgresProjectRepository) ListProjects(ctx context.Context, opts ListP
 	defer func() {
 		if closeErr := rows.Close(); closeErr != nil {
 			// Log the error but don't override the main error
-			fmt.Printf("Warning: failed to close rows: %v\n", closeErr)
+			slog.Warn("failed to close rows in ListProjects", "error", closeErr)
 		}
 	}()
 
@@ -380,8 +369,9 @@ func (r *PostgresProjectRepository) ListProjects(ctx context.Context, opts ListP
 
 // CreateTable creates the projects table if it doesn't exist
 func (r *PostgresProjectRepository) CreateTable(ctx context.Context) error {
+	// Table and indexes are created in a single round trip
 	query := fmt.Sprintf(`
-		CREATE TABLE IF NOT EXISTS %s (
+		CREATE TABLE IF NOT EXISTS %[1]s (
 			project_id VARCHAR(255) PRIMARY KEY,
 			name VARCHAR(255) NOT NULL,
 			description TEXT,
@@ -391,27 +381,16 @@ func (r *PostgresProjectRepository) CreateTable(ctx context.Context) error {
 			updated_at TIMESTAMP WITH TIME ZONE NOT NULL,
 			tags JSONB DEFAULT '{}',
 			metadata JSONB DEFAULT '{}'
-		)
+		);
+		CREATE INDEX IF NOT EXISTS idx_%[1]s_name ON %[1]s (name);
+		CREATE INDEX IF NOT EXISTS idx_%[1]s_status ON %[1]s (status);
+		CREATE INDEX IF NOT EXISTS idx_%[1]s_created_at ON %[1]s (created_at);
+		CREATE INDEX IF NOT EXISTS idx_%[1]s_tags ON %[1]s USING GIN (tags);
 	`, r.tableName)
 
-	_, err := r.db.ExecContext(ctx, query)
-	if err != nil {
+	if _, err := r.db.ExecContext(ctx, query); err != nil {
 		return fmt.Errorf("failed to create projects table: %w", err)
 	}
 
-	// Create indexes for better performance
-	indexes := []string{
-		fmt.Sprintf("CREATE INDEX IF NOT EXISTS idx_%s_name ON %s (name)", r.tableName, r.tableName),
-		fmt.Sprintf("CREATE INDEX IF NOT EXISTS idx_%s_status ON %s (status)", r.tableName, r.tableName),
-		fmt.Sprintf("CREATE INDEX IF NOT EXISTS idx_%s_created_at ON %s (created_at)", r.tableName, r.tableName),
-		fmt.Sprintf("CREATE INDEX IF NOT EXISTS idx_%s_tags ON %s USING GIN (tags)", r.tableName, r.tableName),
-	}
-
-	for _, indexQuery := range indexes {
-		if _, err := r.db.ExecContext(ctx, indexQuery); err != nil {
-			return fmt.Errorf("failed to create index: %w", err)
-		}
-	}
-
 	return nil
 }
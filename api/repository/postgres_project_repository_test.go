@@ -20,11 +20,10 @@ func TestNewPostgresProjectRepository(t *testing.T) {
 }
 
 func TestNewPostgresProjectRepositoryWithDB(t *testing.T) {
-	db, _, err := sqlmock.New()
-	require.NoError(t, err)
-	defer db.Close() //nolint:errcheck // Test cleanup //nolint:errcheck // Test cleanup
+	db, _ := newMockDB(t)
 
-	repo := NewPostgresProjectRepositoryWithDB(db, "test_projects")
+	repo, err := NewPostgresProjectRepositoryWithDB(db, "test_projects")
+	require.NoError(t, err)
 	assert.NotNil(t, repo)
 
 	pgRepo := repo.(*PostgresProjectRepository)
@@ -32,11 +31,9 @@ func TestNewPostgresProjectRepositoryWithDB(t *testing.T) {
 }
 
 func TestPostgresProjectRepository_CreateProject_Success(t *testing.T) {
-	db, mock, err := sqlmock.New()
-	require.NoError(t, err)
-	defer db.Close() //nolint:errcheck // Test cleanup
+	db, mock := newMockDB(t)
 
-	repo := NewPostgresProjectRepositoryWithDB(db, "projects")
+	repo := newTestRepository(t, NewPostgresProjectRepositoryWithDB, db, "projects")
 
 	project := &ProjectRecord{
 		ProjectID:   "proj-12345",
@@ -68,17 +65,15 @@ func TestPostgresProjectRepository_CreateProject_Success(t *testing.T) {
 		).
 		WillReturnResult(sqlmock.NewResult(1, 1))
 
-	err = repo.CreateProject(context.Background(), project)
+	err := repo.CreateProject(context.Background(), project)
 	assert.NoError(t, err)
 	assert.NoError(t, mock.ExpectationsWereMet())
 }
 
 func TestPostgresProjectRepository_CreateProject_DuplicateError(t *testing.T) {
-	db, mock, err := sqlmock.New()
-	require.NoError(t, err)
-	defer db.Close() //nolint:errcheck // Test cleanup
+	db, mock := newMockDB(t)
 
-	repo := NewPostgresProjectRepositoryWithDB(db, "projects")
+	repo := newTestRepository(t, NewPostgresProjectRepositoryWithDB, db, "projects")
 
 	project := &ProjectRecord{
 		ProjectID:   "proj-12345",
@@ -111,18 +106,16 @@ func TestPostgresProjectRepository_CreateProject_DuplicateError(t *testing.T) {
 		).
 		WillReturnError(pqErr)
 
-	err = repo.CreateProject(context.Background(), project)
+	err := repo.CreateProject(context.Background(), project)
 	assert.Error(t, err)
 	assert.Contains(t, err.Error(), "already exists")
 	assert.NoError(t, mock.ExpectationsWereMet())
 }
 
 func TestPostgresProjectRepository_GetProject_Success(t *testing.T) {
-	db, mock, err := sqlmock.New()
-	require.NoError(t, err)
-	defer db.Close() //nolint:errcheck // Test cleanup
+	db, mock := newMockDB(t)
 
-	repo := NewPostgresProjectRepositoryWithDB(db, "projects")
+	repo := newTestRepository(t, NewPostgresProjectRepositoryWithDB, db, "projects")
 
 	projectID := "proj-12345"
 	description := "A test project"
@@ -159,11 +152,9 @@ func TestPostgresProjectRepository_GetProject_Success(t *testing.T) {
 }
 
 func TestPostgresProjectRepository_GetProject_NotFound(t *testing.T) {
-	db, mock, err := sqlmock.New()
-	require.NoError(t, err)
-	defer db.Close() //nolint:errcheck // Test cleanup
+	db, mock := newMockDB(t)
 
-	repo := NewPostgresProjectRepositoryWithDB(db, "projects")
+	repo := newTestRepository(t, NewPostgresProjectRepositoryWithDB, db, "projects")
 
 	projectID := "nonexistent"
 
@@ -178,11 +169,9 @@ func TestPostgresProjectRepository_GetProject_NotFound(t *testing.T) {
 }
 
 func TestPostgresProjectRepository_UpdateProject_Success(t *testing.T) {
-	db, mock, err := sqlmock.New()
-	require.NoError(t, err)
-	defer db.Close() //nolint:errcheck // Test cleanup
+	db, mock := newMockDB(t)
 
-	repo := NewPostgresProjectRepositoryWithDB(db, "projects")
+	repo := newTestRepository(t, NewPostgresProjectRepositoryWithDB, db, "projects")
 
 	project := &ProjectRecord{
 		ProjectID:   "proj-12345",
@@ -212,17 +201,15 @@ func TestPostgresProjectRepository_UpdateProject_Success(t *testing.T) {
 		).
 		WillReturnResult(sqlmock.NewResult(0, 1))
 
-	err = repo.UpdateProject(context.Background(), project)
+	err := repo.UpdateProject(context.Background(), project)
 	assert.NoError(t, err)
 	assert.NoError(t, mock.ExpectationsWereMet())
 }
 
 func TestPostgresProjectRepository_UpdateProject_NotFound(t *testing.T) {
-	db, mock, err := sqlmock.New()
-	require.NoError(t, err)
-	defer db.Close() //nolint:errcheck // Test cleanup
+	db, mock := newMockDB(t)
 
-	repo := NewPostgresProjectRepositoryWithDB(db, "projects")
+	repo := newTestRepository(t, NewPostgresProjectRepositoryWithDB, db, "projects")
 
 	project := &ProjectRecord{
 		ProjectID: "nonexistent",
@@ -246,94 +233,81 @@ func TestPostgresProjectRepository_UpdateProject_NotFound(t *testing.T) {
 		).
 		WillReturnResult(sqlmock.NewResult(0, 0)) // No rows affected
 
-	err = repo.UpdateProject(context.Background(), project)
+	err := repo.UpdateProject(context.Background(), project)
 	assert.Error(t, err)
 	assert.Contains(t, err.Error(), "does not exist")
 	assert.NoError(t, mock.ExpectationsWereMet())
 }
 
-func TestPostgresProjectRepository_DeleteProject_Success(t *testing.T) {
-	db, mock, err := sqlmock.New()
-	require.NoError(t, err)
-	defer db.Close() //nolint:errcheck // Test cleanup
-
-	repo := NewPostgresProjectRepositoryWithDB(db, "projects")
-
-	projectID := "proj-12345"
-
-	mock.ExpectExec(`DELETE FROM projects WHERE project_id`).
-		WithArgs(projectID).
-		WillReturnResult(sqlmock.NewResult(0, 1))
-
-	err = repo.DeleteProject(context.Background(), projectID)
-	assert.NoError(t, err)
-	assert.NoError(t, mock.ExpectationsWereMet())
-}
-
-func TestPostgresProjectRepository_DeleteProject_NotFound(t *testing.T) {
-	db, mock, err := sqlmock.New()
-	require.NoError(t, err)
-	defer db.Close() //nolint:errcheck // Test cleanup
-
-	repo := NewPostgresProjectRepositoryWithDB(db, "projects")
-
-	projectID := "nonexistent"
-
-	mock.ExpectExec(`DELETE FROM projects WHERE project_id`).
-		WithArgs(projectID).
-		WillReturnResult(sqlmock.NewResult(0, 0)) // No rows affected
-
-	err = repo.DeleteProject(context.Background(), projectID)
-	assert.Error(t, err)
-	assert.Contains(t, err.Error(), "does not exist")
-	assert.NoError(t, mock.ExpectationsWereMet())
-}
-
-func TestPostgresProjectRepository_ProjectExists_True(t *testing.T) {
-	db, mock, err := sqlmock.New()
-	require.NoError(t, err)
-	defer db.Close() //nolint:errcheck // Test cleanup
-
-	repo := NewPostgresProjectRepositoryWithDB(db, "projects")
-
-	projectID := "proj-12345"
-
-	rows := sqlmock.NewRows([]string{"exists"}).AddRow(1)
-	mock.ExpectQuery(`SELECT 1 FROM projects WHERE project_id`).
-		WithArgs(projectID).
-		WillReturnRows(rows)
+func TestPostgresProjectRepository_DeleteProject(t *testing.T) {
+	tests := []struct {
+		name         string
+		projectID    string
+		rowsAffected int64
+		expectError  bool
+	}{
+		{name: "existing project", projectID: "proj-12345", rowsAffected: 1},
+		{name: "missing project", projectID: "nonexistent", rowsAffected: 0, expectError: true},
+	}
 
-	exists, err := repo.ProjectExists(context.Background(), projectID)
-	assert.NoError(t, err)
-	assert.True(t, exists)
-	assert.NoError(t, mock.ExpectationsWereMet())
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			db, mock := newMockDB(t)
+
+			repo := newTestRepository(t, NewPostgresProjectRepositoryWithDB, db, "projects")
+
+			mock.ExpectExec(`DELETE FROM projects WHERE project_id`).
+				WithArgs(tt.projectID).
+				WillReturnResult(sqlmock.NewResult(0, tt.rowsAffected))
+
+			err := repo.DeleteProject(context.Background(), tt.projectID)
+			if tt.expectError {
+				assert.Error(t, err)
+				assert.Contains(t, err.Error(), "does not exist")
+			} else {
+				assert.NoError(t, err)
+			}
+			assert.NoError(t, mock.ExpectationsWereMet())
+		})
+	}
 }
 
-func TestPostgresProjectRepository_ProjectExists_False(t *testing.T) {
-	db, mock, err := sqlmock.New()
-	require.NoError(t, err)
-	defer db.Close() //nolint:errcheck // Test cleanup
-
-	repo := NewPostgresProjectRepositoryWithDB(db, "projects")
-
-	projectID := "nonexistent"
-
-	mock.ExpectQuery(`SELECT 1 FROM projects WHERE project_id`).
-		WithArgs(projectID).
-		WillReturnError(sql.ErrNoRows)
+func TestPostgresProjectRepository_ProjectExists(t *testing.T) {
+	tests := []struct {
+		name      string
+		projectID string
+		found     bool
+	}{
+		{name: "existing project", projectID: "proj-12345", found: true},
+		{name: "missing project", projectID: "nonexistent", found: false},
+	}
 
-	exists, err := repo.ProjectExists(context.Background(), projectID)
-	assert.NoError(t, err)
-	assert.False(t, exists)
-	assert.NoError(t, mock.ExpectationsWereMet())
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			db, mock := newMockDB(t)
+
+			repo := newTestRepository(t, NewPostgresProjectRepositoryWithDB, db, "projects")
+
+			query := mock.ExpectQuery(`SELECT 1 FROM projects WHERE project_id`).
+				WithArgs(tt.projectID)
+			if tt.found {
+				query.WillReturnRows(sqlmock.NewRows([]string{"exists"}).AddRow(1))
+			} else {
+				query.WillReturnError(sql.ErrNoRows)
+			}
+
+			exists, err := repo.ProjectExists(context.Background(), tt.projectID)
+			assert.NoError(t, err)
+			assert.Equal(t, tt.found, exists)
+			assert.NoError(t, mock.ExpectationsWereMet())
+		})
+	}
 }
 
 func TestPostgresProjectRepository_ListProjects_Success(t *testing.T) {
-	db, mock, err := sqlmock.New()
-	require.NoError(t, err)
-	defer db.Close() //nolint:errcheck // Test cleanup
+	db, mock := newMockDB(t)
 
-	repo := NewPostgresProjectRepositoryWithDB(db, "projects")
+	repo := newTestRepository(t, NewPostgresProjectRepositoryWithDB, db, "projects")
 
 	maxResults := 2
 	opts := ListProjectsOptions{
@@ -370,11 +344,9 @@ func TestPostgresProjectRepository_ListProjects_Success(t *testing.T) {
 }
 
 func TestPostgresProjectRepository_ListProjects_WithTagFilter(t *testing.T) {
-	db, mock, err := sqlmock.New()
-	require.NoError(t, err)
-	defer db.Close() //nolint:errcheck // Test cleanup
+	db, mock := newMockDB(t)
 
-	repo := NewPostgresProjectRepositoryWithDB(db, "projects")
+	repo := newTestRepository(t, NewPostgresProjectRepositoryWithDB, db, "projects")
 
 	opts := ListProjectsOptions{
 		TagFilter: map[string]string{
@@ -408,27 +380,19 @@ func TestPostgresProjectRepository_ListProjects_WithTagFilter(t *testing.T) {
 }
 
 func TestPostgresProjectRepository_CreateTable_Success(t *testing.T) {
-	db, mock, err := sqlmock.New()
-	require.NoError(t, err)
-	defer db.Close() //nolint:errcheck // Test cleanup
+	db, mock := newMockDB(t)
 
-	repo := NewPostgresProjectRepositoryWithDB(db, "projects")
-
-	// Expect table creation
-	mock.ExpectExec(`CREATE TABLE IF NOT EXISTS projects`).
-		WillReturnResult(sqlmock.NewResult(0, 0))
+	repo := newTestRepository(t, NewPostgresProjectRepositoryWithDB, db, "projects")
 
-	// Expect index creation
-	mock.ExpectExec(`CREATE INDEX IF NOT EXISTS idx_projects_name`).
-		WillReturnResult(sqlmock.NewResult(0, 0))
-	mock.ExpectExec(`CREATE INDEX IF NOT EXISTS idx_projects_status`).
-		WillReturnResult(sqlmock.NewResult(0, 0))
-	mock.ExpectExec(`CREATE INDEX IF NOT EXISTS idx_projects_created_at`).
-		WillReturnResult(sqlmock.NewResult(0, 0))
-	mock.ExpectExec(`CREATE INDEX IF NOT EXISTS idx_projects_tags`).
+	// Expect table and index creation in a single round trip
+	mock.ExpectExec(`CREATE TABLE IF NOT EXISTS projects .*` +
+		`CREATE INDEX IF NOT EXISTS idx_projects_name .*` +
+		`CREATE INDEX IF NOT EXISTS idx_projects_status .*` +
+		`CREATE INDEX IF NOT EXISTS idx_projects_created_at .*` +
+		`CREATE INDEX IF NOT EXISTS idx_projects_tags`).
 		WillReturnResult(sqlmock.NewResult(0, 0))
 
-	err = repo.(*PostgresProjectRepository).CreateTable(context.Background())
+	err := repo.(*PostgresProjectRepository).CreateTable(context.Background())
 	assert.NoError(t, err)
 	assert.NoError(t, mock.ExpectationsWereMet())
 }
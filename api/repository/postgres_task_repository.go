@@ -9,7 +9,6 @@ import (
 	"time"
 
 	"github.com/google/uuid"
-	_ "github.com/lib/pq" // PostgreSQL driver
 
 	"github.com/kazemisoroush/code-refactoring-tool/api/models"
 	conf "github.com/kazemisoroush/code-refactoring-tool/pkg/config"
@@ -21,23 +20,14 @@ type PostgresTaskRepository struct {
 	tableName string
 }
 
-// NewPostgresTaskRepository creates a new PostgreSQL task repository
-func NewPostgresTaskRepository(config PostgresConfig, tableName string) (TaskRepository, error) {
+// NewPostgresTaskRepository creates a new PostgreSQL task repository on the given connection pool
+// and ensures its table exists
+func NewPostgresTaskRepository(db *sql.DB, tableName string) (TaskRepository, error) {
 	if tableName == "" {
 		tableName = conf.DefaultTasksTableName
 	}
-
-	// Build connection string
-	connStr := fmt.Sprintf("host=%s port=%d user=%s password=%s dbname=%s sslmode=%s",
-		config.Host, config.Port, config.Username, config.Password, config.Database, config.SSLMode)
-
-	db, err := sql.Open("postgres", connStr)
-	if err != nil {
-		return nil, fmt.Errorf("failed to open database: %w", err)
-	}
-
-	if err = db.Ping(); err != nil {
-		return nil, fmt.Errorf("failed to ping database: %w", err)
+	if err := validateTableName(tableName); err != nil {
+		return nil, err
 	}
 
 	repo := &PostgresTaskRepository{
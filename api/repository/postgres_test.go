@@ -0,0 +1,126 @@
+package repository
+
+import (
+	"context"
+	"database/sql"
+	"testing"
+
+	"github.com/DATA-DOG/go-sqlmock"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+
+	conf "github.com/kazemisoroush/code-refactoring-tool/pkg/config"
+)
+
+// newMockDB returns a sqlmock-backed *sql.DB that is closed when the test finishes
+func newMockDB(t *testing.T) (*sql.DB, sqlmock.Sqlmock) {
+	t.Helper()
+
+	db, mock, err := sqlmock.New()
+	require.NoError(t, err)
+	t.Cleanup(func() { _ = db.Close() })
+
+	return db, mock
+}
+
+// newTestRepository builds a repository on db with the given constructor and fails the test on error
+func newTestRepository[R any](t *testing.T, newRepo func(*sql.DB, string) (R, error), db *sql.DB, tableName string) R {
+	t.Helper()
+
+	repo, err := newRepo(db, tableName)
+	require.NoError(t, err)
+
+	return repo
+}
+
+func TestPostgresRepositories_CloseKeepsSharedPoolOpen(t *testing.T) {
+	db, mock := newMockDB(t)
+
+	agentRepo := newTestRepository(t, NewPostgresAgentRepositoryWithDB, db, "agents")
+	projectRepo := newTestRepository(t, NewPostgresProjectRepositoryWithDB, db, "projects")
+	codebaseConfigRepo := newTestRepository(t, NewPostgresCodebaseConfigRepositoryWithDB, db, "codebase_configs")
+
+	require.NoError(t, agentRepo.(*PostgresAgentRepository).Close())
+	require.NoError(t, codebaseConfigRepo.(*PostgresCodebaseConfigRepository).Close())
+
+	mock.ExpectQuery(`SELECT 1 FROM projects WHERE project_id`).
+		WithArgs("proj-12345").
+		WillReturnRows(sqlmock.NewRows([]string{"exists"}).AddRow(1))
+
+	exists, err := projectRepo.ProjectExists(context.Background(), "proj-12345")
+	require.NoError(t, err)
+	assert.True(t, exists)
+	assert.NoError(t, mock.ExpectationsWereMet())
+}
+
+func TestPostgresRepositoriesWithDB_EmptyTableNameUsesDefault(t *testing.T) {
+	db, _ := newMockDB(t)
+
+	agentRepo, err := NewPostgresAgentRepositoryWithDB(db, "")
+	require.NoError(t, err)
+	assert.Equal(t, conf.DefaultAgentsTableName, agentRepo.(*PostgresAgentRepository).tableName)
+
+	projectRepo, err := NewPostgresProjectRepositoryWithDB(db, "")
+	require.NoError(t, err)
+	assert.Equal(t, conf.DefaultProjectsTableName, projectRepo.(*PostgresProjectRepository).tableName)
+
+	codebaseConfigRepo, err := NewPostgresCodebaseConfigRepositoryWithDB(db, "")
+	require.NoError(t, err)
+	assert.Equal(t, conf.DefaultCodebaseConfigsTableName, codebaseConfigRepo.(*PostgresCodebaseConfigRepository).tableName)
+
+	userRepo, err := NewPostgresUserRepositoryWithDB(db, "")
+	require.NoError(t, err)
+	assert.Equal(t, conf.DefaultUsersTableName, userRepo.(*PostgresUserRepository).tableName)
+}
+
+func TestPostgresConfig_DSNAndDefaults(t *testing.T) {
+	tests := []struct {
+		name            string
+		config          PostgresConfig
+		expectedDSN     string
+		expectedMaxOpen int
+		expectedMaxIdle int
+	}{
+		{
+			name: "zero values fall back to defaults",
+			config: PostgresConfig{
+				Host:     "localhost",
+				Port:     5432,
+				Database: "code_refactoring_db",
+				Username: "postgres",
+				Password: "secret",
+				SSLMode:  "disable",
+			},
+			expectedDSN:     "host=localhost port=5432 user=postgres password=secret dbname=code_refactoring_db sslmode=disable connect_timeout=10",
+			expectedMaxOpen: conf.DefaultPostgresMaxOpenConns,
+			expectedMaxIdle: conf.DefaultPostgresMaxIdleConns,
+		},
+		{
+			name: "explicit values are kept",
+			config: PostgresConfig{
+				Host:                  "db.example.com",
+				Port:                  6543,
+				Database:              "app",
+				Username:              "app_user",
+				Password:              "pw",
+				SSLMode:               "require",
+				ConnectTimeoutSeconds: 3,
+				MaxOpenConns:          50,
+				MaxIdleConns:          5,
+			},
+			expectedDSN:     "host=db.example.com port=6543 user=app_user password=pw dbname=app sslmode=require connect_timeout=3",
+			expectedMaxOpen: 50,
+			expectedMaxIdle: 5,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			config := tt.config.withDefaults()
+
+			assert.Equal(t, tt.expectedDSN, config.dsn())
+			assert.Equal(t, tt.expectedMaxOpen, config.MaxOpenConns)
+			assert.Equal(t, tt.expectedMaxIdle, config.MaxIdleConns)
+		})
+	}
+}
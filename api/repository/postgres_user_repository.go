@@ -10,6 +10,7 @@ import (
 	"github.com/lib/pq"
 
 	"github.com/kazemisoroush/code-refactoring-tool/api/models"
+	conf "github.com/kazemisoroush/code-refactoring-tool/pkg/config"
 )
 
 // PostgresUserRepository implements UserRepository using PostgreSQL
@@ -18,18 +19,14 @@ type PostgresUserRepository struct {
 	tableName string
 }
 
-// NewPostgresUserRepository creates a new PostgreSQL user repository
-func NewPostgresUserRepository(config PostgresConfig, tableName string) (UserRepository, error) {
-	connStr := fmt.Sprintf("host=%s port=%d user=%s password=%s dbname=%s sslmode=%s",
-		config.Host, config.Port, config.Username, config.Password, config.Database, config.SSLMode)
-
-	db, err := sql.Open("postgres", connStr)
-	if err != nil {
-		return nil, fmt.Errorf("failed to open database connection: %w", err)
+// NewPostgresUserRepository creates a new PostgreSQL user repository on the given connection pool
+// and ensures its table exists
+func NewPostgresUserRepository(db *sql.DB, tableName string) (UserRepository, error) {
+	if tableName == "" {
+		tableName = conf.DefaultUsersTableName
 	}
-
-	if err := db.Ping(); err != nil {
-		return nil, fmt.Errorf("failed to ping database: %w", err)
+	if err := validateTableName(tableName); err != nil {
+		return nil, err
 	}
 
 	repo := &PostgresUserRepository{
@@ -46,11 +43,18 @@ func NewPostgresUserRepository(config PostgresConfig, tableName string) (UserRep
 }
 
 // NewPostgresUserRepositoryWithDB creates a new PostgreSQL user repository with existing DB connection
-func NewPostgresUserRepositoryWithDB(db *sql.DB, tableName string) UserRepository {
+func NewPostgresUserRepositoryWithDB(db *sql.DB, tableName string) (UserRepository, error) {
+	if tableName == "" {
+		tableName = conf.DefaultUsersTableName
+	}
+	if err := validateTableName(tableName); err != nil {
+		return nil, err
+	}
+
 	return &PostgresUserRepository{
 		db:        db,
 		tableName: tableName,
-	}
+	}, nil
 }
 
 // CreateUser creates a new user in the database
@@ -408,8 +412,9 @@ func (r *PostgresUserRepository) RevokeProjectAccess(_ context.Context, _, _ str
 
 // CreateTable creates the users table with appropriate indexes
 func (r *PostgresUserRepository) CreateTable(ctx context.Context) error {
+	// Table and indexes are created in a single round trip
 	query := fmt.Sprintf(`
-		CREATE TABLE IF NOT EXISTS %s (
+		CREATE TABLE IF NOT EXISTS %[1]s (
 			user_id VARCHAR(255) PRIMARY KEY,
 			auth_id VARCHAR(255) UNIQUE NOT NULL,
 			email VARCHAR(255) UNIQUE NOT NULL,
@@ -422,7 +427,13 @@ func (r *PostgresUserRepository) CreateTable(ctx context.Context) error {
 			updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
 			CONSTRAINT valid_role CHECK (role IN ('owner', 'admin', 'developer', 'viewer')),
 			CONSTRAINT valid_status CHECK (status IN ('active', 'inactive', 'pending', 'suspended'))
-		)
+		);
+		CREATE INDEX IF NOT EXISTS idx_%[1]s_auth_id ON %[1]s (auth_id);
+		CREATE INDEX IF NOT EXISTS idx_%[1]s_email ON %[1]s (email);
+		CREATE INDEX IF NOT EXISTS idx_%[1]s_username ON %[1]s (username);
+		CREATE INDEX IF NOT EXISTS idx_%[1]s_role ON %[1]s (role);
+		CREATE INDEX IF NOT EXISTS idx_%[1]s_status ON %[1]s (status);
+		CREATE INDEX IF NOT EXISTS idx_%[1]s_created_at ON %[1]s (created_at);
 	`, r.tableName)
 
 	_, err := r.db.ExecContext(ctx, query)
@@ -430,23 +441,6 @@ func (r *PostgresUserRepository) CreateTable(ctx context.Context) error {
 		return fmt.Errorf("failed to create users table: %w", err)
 	}
 
-	// Create indexes
-	indexes := []string{
-		fmt.Sprintf("CREATE INDEX IF NOT EXISTS idx_%s_auth_id ON %s (auth_id)", r.tableName, r.tableName),
-		fmt.Sprintf("CREATE INDEX IF NOT EXISTS idx_%s_email ON %s (email)", r.tableName, r.tableName),
-		fmt.Sprintf("CREATE INDEX IF NOT EXISTS idx_%s_username ON %s (username)", r.tableName, r.tableName),
-		fmt.Sprintf("CREATE INDEX IF NOT EXISTS idx_%s_role ON %s (role)", r.tableName, r.tableName),
-		fmt.Sprintf("CREATE INDEX IF NOT EXISTS idx_%s_status ON %s (status)", r.tableName, r.tableName),
-		fmt.Sprintf("CREATE INDEX IF NOT EXISTS idx_%s_created_at ON %s (created_at)", r.tableName, r.tableName),
-	}
-
-	for _, indexQuery := range indexes {
-		_, err := r.db.ExecContext(ctx, indexQuery)
-		if err != nil {
-			return fmt.Errorf("failed to create index: %w", err)
-		}
-	}
-
 	return nil
 }
 
@@ -10,7 +10,6 @@ import (
 	"syscall"
 	"time"
 
-	"github.com/aws/aws-sdk-go-v2/config"
 	"github.com/gin-gonic/gin"
 	swaggerFiles "github.com/swaggo/files"
 	ginSwagger "github.com/swaggo/gin-swagger"
@@ -54,50 +53,61 @@ func main() {
 
 	// Initialize Postgres config for repositories
 	postgresConfig := repository.PostgresConfig{
-		Host:     cfg.Postgres.Host,
-		Port:     cfg.Postgres.Port,
-		Database: cfg.Postgres.Database,
-		Username: cfg.Postgres.Username,
-		Password: cfg.Postgres.Password,
-		SSLMode:  cfg.Postgres.SSLMode,
+		Host:                  cfg.Postgres.Host,
+		Port:                  cfg.Postgres.Port,
+		Database:              cfg.Postgres.Database,
+		Username:              cfg.Postgres.Username,
+		Password:              cfg.Postgres.Password,
+		SSLMode:               cfg.Postgres.SSLMode,
+		ConnectTimeoutSeconds: cfg.Postgres.ConnectTimeoutSeconds,
+		MaxOpenConns:          cfg.Postgres.MaxOpenConns,
+		MaxIdleConns:          cfg.Postgres.MaxIdleConns,
 	}
 
+	// Open a single connection pool shared by all repositories
+	db, err := repository.OpenPostgresDB(postgresConfig)
+	if err != nil {
+		slog.Error("failed to connect to PostgreSQL", "error", err)
+		os.Exit(1)
+	}
+	defer func() { _ = db.Close() }()
+
 	// Initialize agent repository
-	agentRepository, err := repository.NewPostgresAgentRepository(postgresConfig, appconfig.DefaultAgentsTableName)
+	agentRepository, err := repository.NewPostgresAgentRepository(db, appconfig.DefaultAgentsTableName)
 	if err != nil {
 		slog.Error("failed to initialize agent repository", "error", err)
 	}
 
 	// Initialize project repository
-	projectRepository, err := repository.NewPostgresProjectRepository(postgresConfig, appconfig.DefaultProjectsTableName)
+	projectRepository, err := repository.NewPostgresProjectRepository(db, appconfig.DefaultProjectsTableName)
 	if err != nil {
 		slog.Error("failed to initialize project repository", "error", err)
 		os.Exit(1)
 	}
 
 	// Initialize codebase repository
-	codebaseRepository, err := repository.NewPostgresCodebaseRepository(postgresConfig, appconfig.DefaultCodebasesTableName)
+	codebaseRepository, err := repository.NewPostgresCodebaseRepository(db, appconfig.DefaultCodebasesTableName)
 	if err != nil {
 		slog.Error("failed to initialize codebase repository", "error", err)
 		os.Exit(1)
 	}
 
 	// Initialize task repository
-	taskRepository, err := repository.NewPostgresTaskRepository(postgresConfig, appconfig.DefaultTasksTableName)
+	taskRepository, err := repository.NewPostgresTaskRepository(db, appconfig.DefaultTasksTableName)
 	if err != nil {
 		slog.Error("failed to initialize task repository", "error", err)
 		os.Exit(1)
 	}
 
 	// Initialize user repository
-	userRepository, err := repository.NewPostgresUserRepository(postgresConfig, appconfig.DefaultUsersTableName)
+	userRepository, err := repository.NewPostgresUserRepository(db, appconfig.DefaultUsersTableName)
 	if err != nil {
 		slog.Error("failed to initialize user repository", "error", err)
 		os.Exit(1)
 	}
 
 	// Initialize codebase configuration repository
-	codebaseConfigRepository, err := repository.NewPostgresCodebaseConfigRepository(postgresConfig, appconfig.DefaultCodebaseConfigsTableName)
+	codebaseConfigRepository, err := repository.NewPostgresCodebaseConfigRepository(db, appconfig.DefaultCodebaseConfigsTableName)
 	if err != nil {
 		slog.Error("failed to initialize codebase configuration repository", "error", err)
 		os.Exit(1)
@@ -131,12 +141,9 @@ func main() {
 	healthController := controllers.NewHealthController(healthService)
 	agentController := controllers.NewAgentController(agentService)
 
-	// Initialize AWS config
-	awsConfig, err := config.LoadDefaultConfig(shutdownCtx, config.WithRegion(cfg.Cognito.Region))
-	if err != nil {
-		slog.Error("failed to load AWS config", "error", err)
-		os.Exit(1)
-	}
+	// Reuse the AWS config resolved during startup, scoped to the Cognito region
+	awsConfig := cfg.AWSConfig.Copy()
+	awsConfig.Region = cfg.Cognito.Region
 
 	// Initialize Cognito provider and authentication middleware
 	cognitoProvider := auth.NewCognitoProvider(awsConfig, cfg.Cognito)
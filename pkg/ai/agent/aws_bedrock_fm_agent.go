@@ -4,7 +4,7 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
-	"log"
+	"log/slog"
 
 	"github.com/aws/aws-sdk-go-v2/aws"
 	"github.com/aws/aws-sdk-go-v2/service/bedrockruntime"
@@ -54,7 +54,10 @@ func (a *AWSBedrockAgent) Ask(ctx context.Context, prompt string) (string, error
 		return "", fmt.Errorf("error parsing response: %w", err)
 	}
 
-	log.Println("response: ", string(output.Body))
+	// Only copy the raw body into a string when debug logging is on
+	if slog.Default().Enabled(ctx, slog.LevelDebug) {
+		slog.Debug("Bedrock response", "model_id", a.ModelID, "body", string(output.Body))
+	}
 
 	// Extract answer from Claude-style output
 	if content, ok := resp["content"].(string); ok {
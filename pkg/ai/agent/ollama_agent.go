@@ -6,6 +6,7 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
+	"log/slog"
 	"net/http"
 	"time"
 )
@@ -68,7 +69,7 @@ func (o *OllamaAgent) Ask(ctx context.Context, prompt string) (string, error) {
 	defer func() {
 		if closeErr := resp.Body.Close(); closeErr != nil {
 			// Log the error but don't fail the request
-			fmt.Printf("Warning: failed to close response body: %v\n", closeErr)
+			slog.Warn("failed to close Ollama response body", "error", closeErr)
 		}
 	}()
 
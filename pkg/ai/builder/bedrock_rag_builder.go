@@ -18,6 +18,9 @@ const (
 	ProviderName = "bedrock"
 )
 
+// invalidTableNameChars matches characters that are not allowed in the RDS table name
+var invalidTableNameChars = regexp.MustCompile(`[^a-zA-Z0-9_]`)
+
 // BedrockRAGBuilder is an implementation of RAGBuilder that uses AWS Bedrock for building the RAG pipeline.
 type BedrockRAGBuilder struct {
 	repoPath  string
@@ -101,8 +104,7 @@ func (b BedrockRAGBuilder) getRDSTableName() string {
 
 	// Replace hyphens and other invalid characters with underscores
 	// Keep only alphanumeric characters and underscores
-	reg := regexp.MustCompile(`[^a-zA-Z0-9_]`)
-	sanitized := reg.ReplaceAllString(baseName, "_")
+	sanitized := invalidTableNameChars.ReplaceAllString(baseName, "_")
 
 	// Ensure it starts with a letter or underscore (SQL identifier requirement)
 	if len(sanitized) > 0 && sanitized[0] >= '0' && sanitized[0] <= '9' {
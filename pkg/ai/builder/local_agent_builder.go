@@ -3,7 +3,7 @@ package builder
 
 import (
 	"context"
-	"fmt"
+	"log/slog"
 
 	"github.com/google/uuid"
 )
@@ -34,7 +34,7 @@ func (l *LocalAgentBuilder) Build(_ context.Context, ragID string) (string, stri
 	// 3. Initialize the connection to the vector store
 
 	// For now, we simulate successful agent creation
-	fmt.Printf("Local agent created with ID: %s, version: %s, using RAG: %s\n", agentID, agentVersion, ragID)
+	slog.Info("Local agent created", "agent_id", agentID, "agent_version", agentVersion, "rag_id", ragID)
 
 	return agentID, agentVersion, nil
 }
@@ -46,7 +46,7 @@ func (l *LocalAgentBuilder) TearDown(_ context.Context, agentID string, agentVer
 	// 2. Disconnect from the vector store
 	// 3. Remove temporary files or configurations
 
-	fmt.Printf("Local agent torn down - ID: %s, version: %s, RAG: %s\n", agentID, agentVersion, ragID)
+	slog.Info("Local agent torn down", "agent_id", agentID, "agent_version", agentVersion, "rag_id", ragID)
 
 	return nil
 }
@@ -4,6 +4,7 @@ package builder
 import (
 	"context"
 	"fmt"
+	"log/slog"
 	"os"
 	"path/filepath"
 	"strings"
@@ -38,7 +39,7 @@ func (l *LocalRAGBuilder) Build(ctx context.Context) (string, error) {
 	// 3. Generate embeddings using a local model
 	// 4. Store embeddings in ChromaDB
 
-	fmt.Printf("Building local RAG pipeline for repository: %s\n", l.repoPath)
+	slog.Info("Building local RAG pipeline", "repo_path", l.repoPath)
 
 	// Simulate scanning the repository
 	err := l.scanRepository(ctx)
@@ -46,7 +47,7 @@ func (l *LocalRAGBuilder) Build(ctx context.Context) (string, error) {
 		return "", fmt.Errorf("failed to scan repository: %w", err)
 	}
 
-	fmt.Printf("Local RAG pipeline created with ID: %s\n", ragID)
+	slog.Info("Local RAG pipeline created", "rag_id", ragID)
 
 	return ragID, nil
 }
@@ -58,7 +59,7 @@ func (l *LocalRAGBuilder) TearDown(_ context.Context, vectorStoreID string, ragI
 	// 2. Clean up any temporary files
 	// 3. Remove cached embeddings
 
-	fmt.Printf("Local RAG pipeline torn down - vector store: %s, RAG ID: %s\n", vectorStoreID, ragID)
+	slog.Info("Local RAG pipeline torn down", "vector_store_id", vectorStoreID, "rag_id", ragID)
 
 	return nil
 }
@@ -109,6 +110,6 @@ func (l *LocalRAGBuilder) scanRepository(_ context.Context) error {
 		return err
 	}
 
-	fmt.Printf("Scanned %d code files in repository\n", fileCount)
+	slog.Info("Scanned repository", "code_files", fileCount)
 	return nil
 }
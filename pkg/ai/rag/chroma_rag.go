@@ -5,6 +5,7 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
+	"log/slog"
 	"net/http"
 	"time"
 )
@@ -65,7 +66,7 @@ func (c *ChromaRAG) Create(ctx context.Context, table string) (string, error) {
 	}
 	defer func() {
 		if closeErr := resp.Body.Close(); closeErr != nil {
-			fmt.Printf("Warning: failed to close response body: %v\n", closeErr)
+			slog.Warn("failed to close ChromaDB response body", "error", closeErr)
 		}
 	}()
 
@@ -94,7 +95,7 @@ func (c *ChromaRAG) Delete(ctx context.Context, id string) error {
 	}
 	defer func() {
 		if closeErr := resp.Body.Close(); closeErr != nil {
-			fmt.Printf("Warning: failed to close response body: %v\n", closeErr)
+			slog.Warn("failed to close ChromaDB response body", "error", closeErr)
 		}
 	}()
 
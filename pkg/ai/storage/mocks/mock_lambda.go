@@ -0,0 +1,56 @@
+// Code generated by MockGen. DO NOT EDIT.
+// Source: github.com/kazemisoroush/code-refactoring-tool/pkg/ai/storage (interfaces: LambdaClient)
+
+// Package mocks is a generated GoMock package.
+package mocks
+
+import (
+	context "context"
+	reflect "reflect"
+
+	lambda "github.com/aws/aws-sdk-go-v2/service/lambda"
+	gomock "github.com/golang/mock/gomock"
+)
+
+// MockLambdaClient is a mock of LambdaClient interface.
+type MockLambdaClient struct {
+	ctrl     *gomock.Controller
+	recorder *MockLambdaClientMockRecorder
+}
+
+// MockLambdaClientMockRecorder is the mock recorder for MockLambdaClient.
+type MockLambdaClientMockRecorder struct {
+	mock *MockLambdaClient
+}
+
+// NewMockLambdaClient creates a new mock instance.
+func NewMockLambdaClient(ctrl *gomock.Controller) *MockLambdaClient {
+	mock := &MockLambdaClient{ctrl: ctrl}
+	mock.recorder = &MockLambdaClientMockRecorder{mock}
+	return mock
+}
+
+// EXPECT returns an object that allows the caller to indicate expected use.
+func (m *MockLambdaClient) EXPECT() *MockLambdaClientMockRecorder {
+	return m.recorder
+}
+
+// Invoke mocks base method.
+func (m *MockLambdaClient) Invoke(arg0 context.Context, arg1 *lambda.InvokeInput, arg2 ...func(*lambda.Options)) (*lambda.InvokeOutput, error) {
+	m.ctrl.T.Helper()
+	varargs := []interface{}{arg0, arg1}
+	for _, a := range arg2 {
+		varargs = append(varargs, a)
+	}
+	ret := m.ctrl.Call(m, "Invoke", varargs...)
+	ret0, _ := ret[0].(*lambda.InvokeOutput)
+	ret1, _ := ret[1].(error)
+	return ret0, ret1
+}
+
+// Invoke indicates an expected call of Invoke.
+func (mr *MockLambdaClientMockRecorder) Invoke(arg0, arg1 interface{}, arg2 ...interface{}) *gomock.Call {
+	mr.mock.ctrl.T.Helper()
+	varargs := append([]interface{}{arg0, arg1}, arg2...)
+	return mr.mock.ctrl.RecordCallWithMethodType(mr.mock, "Invoke", reflect.TypeOf((*MockLambdaClient)(nil).Invoke), varargs...)
+}
@@ -7,21 +7,41 @@ import (
 	"encoding/json"
 	"errors"
 	"fmt"
+	"log/slog"
+	"sync"
 
 	"github.com/aws/aws-sdk-go-v2/aws"
 	"github.com/aws/aws-sdk-go-v2/service/lambda"
 	"github.com/aws/aws-sdk-go-v2/service/lambda/types"
 )
 
+// LambdaClient is the subset of the Lambda API used to invoke the schema Lambda
+//
+//go:generate mockgen -destination=./mocks/mock_lambda.go -mock_names=LambdaClient=MockLambdaClient -package=mocks . LambdaClient
+type LambdaClient interface {
+	Invoke(ctx context.Context, params *lambda.InvokeInput, optFns ...func(*lambda.Options)) (*lambda.InvokeOutput, error)
+}
+
 // RDSPostgresStorage is a client that ensures a Postgres schema exists
 // by invoking a Lambda function which connects to the RDS instance and
 // creates the schema if it does not already exist.
 type RDSPostgresStorage struct {
-	client    *lambda.Client
+	client    LambdaClient
 	lambdaARN string
+
+	// ensured records the database/table pairs already created by this client
+	// so repeat calls skip the Lambda round trip
+	ensured sync.Map
+}
+
+// schemaKey identifies an ensured table; a struct avoids collisions between names containing dots
+type schemaKey struct {
+	database string
+	table    string
 }
 
-var response struct {
+// rdsPostgresSchemaResponse is the payload returned by the schema Lambda
+type rdsPostgresSchemaResponse struct {
 	Status  string `json:"status"`
 	Message string `json:"message"`
 }
@@ -30,15 +50,27 @@ var response struct {
 // The Lambda must accept a JSON payload of the form { "table": "<table_name>" }
 // and ensure the schema is created in a Postgres database.
 func NewRDSPostgresStorage(awsConfig aws.Config, lambdaARN string) Storage {
+	return NewRDSPostgresStorageWithClient(lambda.NewFromConfig(awsConfig), lambdaARN)
+}
+
+// NewRDSPostgresStorageWithClient initializes an RDSPostgresStorage with an existing Lambda client.
+// This is primarily used for testing with mock clients.
+func NewRDSPostgresStorageWithClient(client LambdaClient, lambdaARN string) Storage {
 	return &RDSPostgresStorage{
-		client:    lambda.NewFromConfig(awsConfig),
+		client:    client,
 		lambdaARN: lambdaARN,
 	}
 }
 
 // EnsureSchema triggers the Lambda function to create the schema/table in the RDS Postgres database.
 // It sends the database name and table name in the request payload and parses the response to confirm success or capture errors.
+// Once a schema has been ensured successfully, later calls for the same database and table return without invoking the Lambda.
 func (c *RDSPostgresStorage) EnsureSchema(ctx context.Context, databaseName string, tableName string) error {
+	key := schemaKey{database: databaseName, table: tableName}
+	if _, ok := c.ensured.Load(key); ok {
+		return nil
+	}
+
 	payload := map[string]string{
 		"database": databaseName,
 		"table":    tableName,
@@ -57,6 +89,7 @@ func (c *RDSPostgresStorage) EnsureSchema(ctx context.Context, databaseName stri
 		return fmt.Errorf("error invoking Lambda function: %w", err)
 	}
 
+	var response rdsPostgresSchemaResponse
 	err = json.Unmarshal(output.Payload, &response)
 	if err != nil {
 		return fmt.Errorf("failed to parse Lambda response payload: %w", err)
@@ -66,6 +99,7 @@ func (c *RDSPostgresStorage) EnsureSchema(ctx context.Context, databaseName stri
 		return errors.New("Lambda error: " + response.Message)
 	}
 
-	fmt.Println("EnsureSchema success:", response.Message)
+	c.ensured.Store(key, struct{}{})
+	slog.Info("Schema ensured", "database", databaseName, "table", tableName, "message", response.Message)
 	return nil
 }
@@ -0,0 +1,131 @@
+package storage
+
+import (
+	"context"
+	"encoding/json"
+	"errors"
+	"testing"
+
+	"github.com/aws/aws-sdk-go-v2/aws"
+	"github.com/aws/aws-sdk-go-v2/service/lambda"
+	"github.com/aws/aws-sdk-go-v2/service/lambda/types"
+	"github.com/golang/mock/gomock"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+
+	"github.com/kazemisoroush/code-refactoring-tool/pkg/ai/storage/mocks"
+)
+
+const testSchemaLambdaARN = "arn:aws:lambda:us-east-1:123456789012:function:schema"
+
+// schemaInvokeInput builds the Lambda input EnsureSchema sends for a database/table pair
+func schemaInvokeInput(t *testing.T, databaseName, tableName string) *lambda.InvokeInput {
+	t.Helper()
+
+	payload, err := json.Marshal(map[string]string{"database": databaseName, "table": tableName})
+	require.NoError(t, err)
+
+	return &lambda.InvokeInput{
+		FunctionName:   aws.String(testSchemaLambdaARN),
+		InvocationType: types.InvocationTypeRequestResponse,
+		Payload:        payload,
+	}
+}
+
+// schemaInvokeOutput builds a Lambda output carrying the given schema response
+func schemaInvokeOutput(t *testing.T, response rdsPostgresSchemaResponse) *lambda.InvokeOutput {
+	t.Helper()
+
+	payload, err := json.Marshal(response)
+	require.NoError(t, err)
+
+	return &lambda.InvokeOutput{Payload: payload}
+}
+
+func TestRDSPostgresStorage_EnsureSchema_CachesSuccess(t *testing.T) {
+	ctrl := gomock.NewController(t)
+	defer ctrl.Finish()
+
+	client := mocks.NewMockLambdaClient(ctrl)
+	success := schemaInvokeOutput(t, rdsPostgresSchemaResponse{Status: "success", Message: "created"})
+
+	// Each database/table pair invokes the Lambda exactly once
+	client.EXPECT().
+		Invoke(gomock.Any(), schemaInvokeInput(t, "code_refactoring_db", "repo_a")).
+		Return(success, nil).
+		Times(1)
+	client.EXPECT().
+		Invoke(gomock.Any(), schemaInvokeInput(t, "code_refactoring_db", "repo_b")).
+		Return(success, nil).
+		Times(1)
+	client.EXPECT().
+		Invoke(gomock.Any(), schemaInvokeInput(t, "other_db", "repo_a")).
+		Return(success, nil).
+		Times(1)
+	// Names containing dots must not share an entry
+	client.EXPECT().
+		Invoke(gomock.Any(), schemaInvokeInput(t, "a.b", "c")).
+		Return(success, nil).
+		Times(1)
+	client.EXPECT().
+		Invoke(gomock.Any(), schemaInvokeInput(t, "a", "b.c")).
+		Return(success, nil).
+		Times(1)
+
+	store := NewRDSPostgresStorageWithClient(client, testSchemaLambdaARN)
+	ctx := context.Background()
+
+	require.NoError(t, store.EnsureSchema(ctx, "code_refactoring_db", "repo_a"))
+	require.NoError(t, store.EnsureSchema(ctx, "code_refactoring_db", "repo_a"))
+	require.NoError(t, store.EnsureSchema(ctx, "code_refactoring_db", "repo_b"))
+	require.NoError(t, store.EnsureSchema(ctx, "other_db", "repo_a"))
+	require.NoError(t, store.EnsureSchema(ctx, "a.b", "c"))
+	require.NoError(t, store.EnsureSchema(ctx, "a", "b.c"))
+}
+
+func TestRDSPostgresStorage_EnsureSchema_DoesNotCacheFailures(t *testing.T) {
+	tests := []struct {
+		name     string
+		response rdsPostgresSchemaResponse
+		err      error
+	}{
+		{
+			name: "invoke error",
+			err:  errors.New("throttled"),
+		},
+		{
+			name:     "lambda reports error",
+			response: rdsPostgresSchemaResponse{Status: "error", Message: "permission denied"},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			ctrl := gomock.NewController(t)
+			defer ctrl.Finish()
+
+			client := mocks.NewMockLambdaClient(ctrl)
+			input := schemaInvokeInput(t, "code_refactoring_db", "repo_a")
+
+			failure := client.EXPECT().Invoke(gomock.Any(), input).Times(1)
+			if tt.err != nil {
+				failure.Return(nil, tt.err)
+			} else {
+				failure.Return(schemaInvokeOutput(t, tt.response), nil)
+			}
+
+			// Once the Lambda recovers, the next call must invoke it again instead of hitting a cached entry
+			recovery := client.EXPECT().
+				Invoke(gomock.Any(), input).
+				Return(schemaInvokeOutput(t, rdsPostgresSchemaResponse{Status: "success"}), nil).
+				Times(1)
+			gomock.InOrder(failure, recovery)
+
+			store := NewRDSPostgresStorageWithClient(client, testSchemaLambdaARN)
+			ctx := context.Background()
+
+			assert.Error(t, store.EnsureSchema(ctx, "code_refactoring_db", "repo_a"))
+			require.NoError(t, store.EnsureSchema(ctx, "code_refactoring_db", "repo_a"))
+		})
+	}
+}
@@ -84,12 +84,15 @@ type MetricsConfig struct {
 
 // PostgresConfig represents the configuration for PostgreSQL connection
 type PostgresConfig struct {
-	Host     string `envconfig:"HOST" default:"localhost"`
-	Port     int    `envconfig:"PORT" default:"5432"`
-	Database string `envconfig:"DATABASE" default:"code_refactoring_db"`
-	Username string `envconfig:"USERNAME" default:"postgres"`
-	Password string `envconfig:"PASSWORD"`
-	SSLMode  string `envconfig:"SSL_MODE" default:"disable"`
+	Host                  string `envconfig:"HOST" default:"localhost"`
+	Port                  int    `envconfig:"PORT" default:"5432"`
+	Database              string `envconfig:"DATABASE" default:"code_refactoring_db"`
+	Username              string `envconfig:"USERNAME" default:"postgres"`
+	Password              string `envconfig:"PASSWORD"`
+	SSLMode               string `envconfig:"SSL_MODE" default:"disable"`
+	ConnectTimeoutSeconds int    `envconfig:"CONNECT_TIMEOUT_SECONDS"` // Zero uses DefaultPostgresConnectTimeoutSeconds when the pool is opened
+	MaxOpenConns          int    `envconfig:"MAX_OPEN_CONNS"`          // Zero uses DefaultPostgresMaxOpenConns when the pool is opened
+	MaxIdleConns          int    `envconfig:"MAX_IDLE_CONNS"`          // Zero uses DefaultPostgresMaxIdleConns when the pool is opened
 }
 
 // DatabaseSecret represents the structure of the secret stored in AWS Secrets Manager
@@ -110,15 +113,12 @@ type GitConfig struct {
 	Email       string `envconfig:"EMAIL" default:"bot@example.com"`
 }
 
+// gitHubURLRegex matches GitHub repo URLs (HTTPS and SSH formats), compiled once at package init
+var gitHubURLRegex = regexp.MustCompile(`^(https:\/\/github\.com\/[\w-]+\/[\w.-]+(\.git)?|git@github\.com:[\w-]+\/[\w.-]+(\.git)?)$`)
+
 // validateRepositoryURL ensures the RepoURL matches the expected GitHub URL pattern
 func validateRepositoryURL(url string) error {
-	// Regex for GitHub repo URL (HTTPS and SSH formats)
-	gitHubURLRegex := `^(https:\/\/github\.com\/[\w-]+\/[\w.-]+(\.git)?|git@github\.com:[\w-]+\/[\w.-]+(\.git)?)$`
-	matched, err := regexp.MatchString(gitHubURLRegex, url)
-	if err != nil {
-		return fmt.Errorf("failed to validate GitHub URL: %w", err)
-	}
-	if !matched {
+	if !gitHubURLRegex.MatchString(url) {
 		return errors.New("invalid GitHub repository URL format")
 	}
 	return nil
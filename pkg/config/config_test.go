@@ -82,44 +82,35 @@ func TestLoadConfig_MissingVariables(t *testing.T) {
 }
 
 func TestLoadConfig_InvalidGitHubURL(t *testing.T) {
-	// Arrange: Set an invalid GitHub repo URL
-	err := os.Setenv("GIT_CODEBASE_URL", "https://invalid.com/repo.git")
-	require.NoError(t, err, "Setenv should not return an error")
-	err = os.Setenv("GIT_TOKEN", "ghp_testtoken123")
-	require.NoError(t, err, "Setenv should not return an error")
-	err = os.Setenv("KNOWLEDGE_BASE_SERVICE_ROLE_ARN", "arn:aws:iam::123456789012:role/KnowledgeBaseRole")
-	require.NoError(t, err, "Setenv should not return an error")
-	err = os.Setenv("AGENT_SERVICE_ROLE_ARN", "arn:aws:iam::123456789012:role/AgentRole")
-	require.NoError(t, err, "Setenv should not return an error")
+	// Arrange: Set everything except the repo URL once, then vary only the URL per case
+	setBaseEnv(t, "", "ghp_testtoken123")
+	t.Setenv("KNOWLEDGE_BASE_SERVICE_ROLE_ARN", "arn:aws:iam::123456789012:role/KnowledgeBaseRole")
+	t.Setenv("AGENT_SERVICE_ROLE_ARN", "arn:aws:iam::123456789012:role/AgentRole")
 	// Set all required ARNs to avoid CloudFormation calls
-	err = os.Setenv("RDS_POSTGRES_INSTANCE_ARN", "arn:aws:rds:us-west-2:123456789012:cluster:my-aurora-cluster")
-	require.NoError(t, err, "Setenv should not return an error")
-	err = os.Setenv("RDS_POSTGRES_SCHEMA_ENSURE_LAMBDA_ARN", "arn:aws:lambda:us-west-2:123456789012:function:schema-lambda")
-	require.NoError(t, err, "Setenv should not return an error")
-	err = os.Setenv("S3_BUCKET_NAME", "my-s3-bucket")
-	require.NoError(t, err, "Setenv should not return an error")
-	err = os.Setenv("COGNITO_USER_POOL_ID", "us-east-1_123456789")
-	require.NoError(t, err, "Setenv should not return an error")
-	err = os.Setenv("COGNITO_CLIENT_ID", "1234567890abcdef")
-	require.NoError(t, err, "Setenv should not return an error")
-	err = os.Setenv("POSTGRES_PASSWORD", "testpassword123")
-	require.NoError(t, err, "Setenv should not return an error")
+	t.Setenv("RDS_POSTGRES_INSTANCE_ARN", "arn:aws:rds:us-west-2:123456789012:cluster:my-aurora-cluster")
+	t.Setenv("RDS_POSTGRES_SCHEMA_ENSURE_LAMBDA_ARN", "arn:aws:lambda:us-west-2:123456789012:function:schema-lambda")
+	t.Setenv("S3_BUCKET_NAME", "my-s3-bucket")
 
-	defer os.Unsetenv("GIT_CODEBASE_URL")                      //nolint:errcheck
-	defer os.Unsetenv("GIT_TOKEN")                             //nolint:errcheck
-	defer os.Unsetenv("KNOWLEDGE_BASE_SERVICE_ROLE_ARN")       //nolint:errcheck
-	defer os.Unsetenv("AGENT_SERVICE_ROLE_ARN")                //nolint:errcheck
-	defer os.Unsetenv("RDS_POSTGRES_INSTANCE_ARN")             //nolint:errcheck
-	defer os.Unsetenv("RDS_POSTGRES_SCHEMA_ENSURE_LAMBDA_ARN") //nolint:errcheck
-	defer os.Unsetenv("S3_BUCKET_NAME")                        //nolint:errcheck
-	defer os.Unsetenv("COGNITO_USER_POOL_ID")                  //nolint:errcheck
-	defer os.Unsetenv("COGNITO_CLIENT_ID")                     //nolint:errcheck
-	defer os.Unsetenv("POSTGRES_PASSWORD")                     //nolint:errcheck
+	tests := []struct {
+		name    string
+		repoURL string
+	}{
+		{name: "non-GitHub host", repoURL: "https://invalid.com/repo.git"},
+		{name: "plain http", repoURL: "http://github.com/example/repo.git"},
+		{name: "missing repository", repoURL: "https://github.com/example"},
+		{name: "non-GitHub SSH host", repoURL: "git@gitlab.com:example/repo.git"},
+	}
 
-	// Act: Attempt to load configuration
-	_, err = config.LoadConfig()
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			t.Setenv("GIT_CODEBASE_URL", tt.repoURL)
+
+			// Act: Attempt to load configuration
+			_, err := config.LoadConfig()
 
-	// Assert: Expect an error due to invalid URL format
-	assert.Error(t, err, "LoadConfig should return an error for an invalid GitHub repository URL")
-	assert.Contains(t, err.Error(), "invalid GitHub repository URL format", "Error message should indicate invalid format")
+			// Assert: Expect an error due to invalid URL format
+			assert.Error(t, err, "LoadConfig should return an error for an invalid GitHub repository URL")
+			assert.Contains(t, err.Error(), "invalid GitHub repository URL format", "Error message should indicate invalid format")
+		})
+	}
 }
@@ -1,7 +1,6 @@
 package config_test
 
 import (
-	"os"
 	"testing"
 
 	"github.com/aws/aws-sdk-go-v2/aws"
@@ -16,6 +15,16 @@ import (
 	"github.com/kazemisoroush/code-refactoring-tool/pkg/config/mocks"
 )
 
+// setBaseEnv sets the environment every LoadConfig test needs; t.Setenv restores it after the test
+func setBaseEnv(t *testing.T, repoURL, token string) {
+	t.Helper()
+	t.Setenv("GIT_CODEBASE_URL", repoURL)
+	t.Setenv("GIT_TOKEN", token)
+	t.Setenv("COGNITO_USER_POOL_ID", "us-east-1_123456789")
+	t.Setenv("COGNITO_CLIENT_ID", "1234567890abcdef")
+	t.Setenv("POSTGRES_PASSWORD", "testpassword123")
+}
+
 func TestLoadConfigWithMocks_Success(t *testing.T) {
 	// Setup
 	ctrl := gomock.NewController(t)
@@ -29,24 +38,7 @@ func TestLoadConfigWithMocks_Success(t *testing.T) {
 	expectedRepoURL := "https://github.com/example/repo.git"
 	expectedToken := "ghp_testtoken123"
 
-	err := os.Setenv("GIT_CODEBASE_URL", expectedRepoURL)
-	require.NoError(t, err)
-	err = os.Setenv("GIT_TOKEN", expectedToken)
-	require.NoError(t, err)
-	err = os.Setenv("COGNITO_USER_POOL_ID", "us-east-1_123456789")
-	require.NoError(t, err)
-	err = os.Setenv("COGNITO_CLIENT_ID", "1234567890abcdef")
-	require.NoError(t, err)
-	err = os.Setenv("POSTGRES_PASSWORD", "testpassword123")
-	require.NoError(t, err)
-
-	defer func() {
-		os.Unsetenv("GIT_CODEBASE_URL")     //nolint:errcheck
-		os.Unsetenv("GIT_TOKEN")            //nolint:errcheck
-		os.Unsetenv("COGNITO_USER_POOL_ID") //nolint:errcheck
-		os.Unsetenv("COGNITO_CLIENT_ID")    //nolint:errcheck
-		os.Unsetenv("POSTGRES_PASSWORD")    //nolint:errcheck
-	}()
+	setBaseEnv(t, expectedRepoURL, expectedToken)
 
 	// Mock CloudFormation response
 	stackOutput := &cfn.DescribeStacksOutput{
@@ -128,24 +120,7 @@ func TestLoadConfigWithMocks_NoSecretARN(t *testing.T) {
 	loader := config.NewLoader(mockCfnClient, mockSecretsClient)
 
 	// Set environment variables
-	err := os.Setenv("GIT_CODEBASE_URL", "https://github.com/example/repo.git")
-	require.NoError(t, err)
-	err = os.Setenv("GIT_TOKEN", "ghp_testtoken123")
-	require.NoError(t, err)
-	err = os.Setenv("COGNITO_USER_POOL_ID", "us-east-1_123456789")
-	require.NoError(t, err)
-	err = os.Setenv("COGNITO_CLIENT_ID", "1234567890abcdef")
-	require.NoError(t, err)
-	err = os.Setenv("POSTGRES_PASSWORD", "testpassword123")
-	require.NoError(t, err)
-
-	defer func() {
-		os.Unsetenv("GIT_CODEBASE_URL")     //nolint:errcheck
-		os.Unsetenv("GIT_TOKEN")            //nolint:errcheck
-		os.Unsetenv("COGNITO_USER_POOL_ID") //nolint:errcheck
-		os.Unsetenv("COGNITO_CLIENT_ID")    //nolint:errcheck
-		os.Unsetenv("POSTGRES_PASSWORD")    //nolint:errcheck
-	}()
+	setBaseEnv(t, "https://github.com/example/repo.git", "ghp_testtoken123")
 
 	// Mock CloudFormation response without secret ARN
 	stackOutput := &cfn.DescribeStacksOutput{
@@ -191,6 +166,62 @@ func TestLoadConfigWithMocks_NoSecretARN(t *testing.T) {
 	assert.Equal(t, "testpassword123", cfg.Postgres.Password)
 }
 
+func TestLoadConfigWithMocks_KnownSecretARN(t *testing.T) {
+	// Setup
+	ctrl := gomock.NewController(t)
+	defer ctrl.Finish()
+
+	mockCfnClient := mocks.NewMockCloudFormationClient(ctrl)
+	mockSecretsClient := mocks.NewMockSecretsManagerClient(ctrl)
+	loader := config.NewLoader(mockCfnClient, mockSecretsClient)
+
+	// Set environment variables, including the secret ARN
+	secretARN := "arn:aws:secretsmanager:us-east-1:123456789012:secret:rds-credentials"
+
+	setBaseEnv(t, "https://github.com/example/repo.git", "ghp_testtoken123")
+	t.Setenv("AI_BEDROCK_RDS_POSTGRES_CREDENTIALS_SECRET_ARN", secretARN)
+
+	// Mock CloudFormation response
+	stackOutput := &cfn.DescribeStacksOutput{
+		Stacks: []cfnTypes.Stack{
+			{
+				Outputs: []cfnTypes.Output{
+					{
+						OutputKey:   aws.String("BucketName"),
+						OutputValue: aws.String("my-s3-bucket"),
+					},
+				},
+			},
+		},
+	}
+
+	mockCfnClient.EXPECT().
+		DescribeStacks(gomock.Any(), gomock.Any()).
+		Return(stackOutput, nil).
+		Times(1)
+
+	// Mock Secrets Manager response for the ARN from the environment
+	secretOutput := &secretsmanager.GetSecretValueOutput{
+		SecretString: aws.String(`{"username": "postgres", "password": "secretpassword", "host": "mydb.example.com", "port": 5432, "dbname": "code_refactoring_db"}`),
+	}
+
+	mockSecretsClient.EXPECT().
+		GetSecretValue(gomock.Any(), &secretsmanager.GetSecretValueInput{SecretId: aws.String(secretARN)}).
+		Return(secretOutput, nil).
+		Times(1)
+
+	// Act
+	cfg, err := config.LoadConfigWithDependencies(loader)
+
+	// Assert
+	require.NoError(t, err)
+	assert.Equal(t, "my-s3-bucket", cfg.AI.Bedrock.S3BucketName)
+	assert.Equal(t, secretARN, cfg.AI.Bedrock.RDSPostgres.CredentialsSecretARN)
+	assert.Equal(t, "mydb.example.com", cfg.Postgres.Host)
+	assert.Equal(t, "secretpassword", cfg.Postgres.Password)
+	assert.Equal(t, "require", cfg.Postgres.SSLMode)
+}
+
 func TestLoadConfigWithMocks_LocalAIEnabled_SkipsAWSCalls(t *testing.T) {
 	// Setup
 	ctrl := gomock.NewController(t)
@@ -204,34 +235,11 @@ func TestLoadConfigWithMocks_LocalAIEnabled_SkipsAWSCalls(t *testing.T) {
 	expectedRepoURL := "https://github.com/example/repo.git"
 	expectedToken := "ghp_testtoken123"
 
-	err := os.Setenv("GIT_CODEBASE_URL", expectedRepoURL)
-	require.NoError(t, err)
-	err = os.Setenv("GIT_TOKEN", expectedToken)
-	require.NoError(t, err)
-	err = os.Setenv("COGNITO_USER_POOL_ID", "us-east-1_123456789")
-	require.NoError(t, err)
-	err = os.Setenv("COGNITO_CLIENT_ID", "1234567890abcdef")
-	require.NoError(t, err)
-	err = os.Setenv("POSTGRES_PASSWORD", "testpassword123")
-	require.NoError(t, err)
+	setBaseEnv(t, expectedRepoURL, expectedToken)
 	// Enable LocalAI
-	err = os.Setenv("AI_LOCAL_ENABLED", "true")
-	require.NoError(t, err)
-	err = os.Setenv("AI_LOCAL_OLLAMA_URL", "http://ollama:11434")
-	require.NoError(t, err)
-	err = os.Setenv("AI_LOCAL_CHROMA_URL", "http://chromadb:8000")
-	require.NoError(t, err)
-
-	defer func() {
-		os.Unsetenv("GIT_CODEBASE_URL")     //nolint:errcheck
-		os.Unsetenv("GIT_TOKEN")            //nolint:errcheck
-		os.Unsetenv("COGNITO_USER_POOL_ID") //nolint:errcheck
-		os.Unsetenv("COGNITO_CLIENT_ID")    //nolint:errcheck
-		os.Unsetenv("POSTGRES_PASSWORD")    //nolint:errcheck
-		os.Unsetenv("AI_LOCAL_ENABLED")     //nolint:errcheck
-		os.Unsetenv("AI_LOCAL_OLLAMA_URL")  //nolint:errcheck
-		os.Unsetenv("AI_LOCAL_CHROMA_URL")  //nolint:errcheck
-	}()
+	t.Setenv("AI_LOCAL_ENABLED", "true")
+	t.Setenv("AI_LOCAL_OLLAMA_URL", "http://ollama:11434")
+	t.Setenv("AI_LOCAL_CHROMA_URL", "http://chromadb:8000")
 
 	// Expect NO calls to CloudFormation or Secrets Manager when LocalAI is enabled
 	// mockCfnClient.EXPECT() - no expectations set, test will fail if called
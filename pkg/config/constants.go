@@ -1,6 +1,9 @@
 package config
 
-import "errors"
+import (
+	"errors"
+	"time"
+)
 
 var (
 	// ErrUnsupportedAIProvider is returned when an unsupported AI provider is specified
@@ -70,6 +73,30 @@ const (
 	DefaultGitBranch = "main"
 )
 
+// Secrets Manager client settings for the startup credentials lookup, so a slow or failing call can't stall startup
+const (
+	// DefaultSecretsManagerRetryMaxAttempts caps attempts per Secrets Manager call, including the first
+	DefaultSecretsManagerRetryMaxAttempts = 2
+	// DefaultSecretsManagerConnectTimeout bounds how long dialing the Secrets Manager endpoint may take
+	DefaultSecretsManagerConnectTimeout = 2 * time.Second
+	// DefaultSecretsManagerReadTimeout bounds how long to wait for Secrets Manager response headers
+	DefaultSecretsManagerReadTimeout = 5 * time.Second
+)
+
+// PostgreSQL connection pool defaults, applied when the corresponding setting is unset
+const (
+	// DefaultPostgresConnectTimeoutSeconds bounds how long establishing a PostgreSQL connection may take
+	DefaultPostgresConnectTimeoutSeconds = 10
+	// DefaultPostgresMaxOpenConns is the maximum number of open connections in a PostgreSQL pool
+	DefaultPostgresMaxOpenConns = 25
+	// DefaultPostgresMaxIdleConns is the number of idle PostgreSQL connections kept warm for reuse
+	DefaultPostgresMaxIdleConns = 10
+	// DefaultPostgresConnMaxIdleTime is how long an idle PostgreSQL connection is kept before closing
+	DefaultPostgresConnMaxIdleTime = 5 * time.Minute
+	// DefaultPostgresConnMaxLifetime is the maximum lifetime of a PostgreSQL connection
+	DefaultPostgresConnMaxLifetime = 30 * time.Minute
+)
+
 var (
 	// FoundationModels is a list of AWS Bedrock foundation models to be used in the application.
 	FoundationModels = []string{
@@ -2,8 +2,11 @@ package config
 
 import (
 	"context"
+	"net"
+	"net/http"
 
 	"github.com/aws/aws-sdk-go-v2/aws"
+	awshttp "github.com/aws/aws-sdk-go-v2/aws/transport/http"
 	"github.com/aws/aws-sdk-go-v2/service/secretsmanager"
 )
 
@@ -19,10 +22,22 @@ type DefaultSecretsManagerClient struct {
 	client *secretsmanager.Client
 }
 
-// NewSecretsManagerClient creates a new Secrets Manager client
+// NewSecretsManagerClient creates a new Secrets Manager client with capped retries and connect/read timeouts.
+// The limits apply to this client only; the shared AWS config keeps the SDK defaults.
 func NewSecretsManagerClient(cfg aws.Config) SecretsManagerClient {
+	httpClient := awshttp.NewBuildableClient().
+		WithDialerOptions(func(d *net.Dialer) {
+			d.Timeout = DefaultSecretsManagerConnectTimeout
+		}).
+		WithTransportOptions(func(tr *http.Transport) {
+			tr.ResponseHeaderTimeout = DefaultSecretsManagerReadTimeout
+		})
+
 	return &DefaultSecretsManagerClient{
-		client: secretsmanager.NewFromConfig(cfg),
+		client: secretsmanager.NewFromConfig(cfg, func(o *secretsmanager.Options) {
+			o.RetryMaxAttempts = DefaultSecretsManagerRetryMaxAttempts
+			o.HTTPClient = httpClient
+		}),
 	}
 }
 
@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"log/slog"
 	"strings"
+	"sync"
 
 	"github.com/aws/aws-sdk-go-v2/aws"
 	"github.com/kazemisoroush/code-refactoring-tool/api/models"
@@ -26,6 +27,10 @@ type DefaultAIInfrastructureFactory struct {
 
 	// Git configuration
 	gitConfig config.GitConfig
+
+	// Schema storage, built on first Bedrock use and shared across requests so its Lambda client is reused
+	schemaStorage     storage.Storage
+	schemaStorageOnce sync.Once
 }
 
 // NewAIInfrastructureFactory creates a new AI infrastructure factory
@@ -125,25 +130,8 @@ func (f *DefaultAIInfrastructureFactory) createBedrockInfrastructure(ctx context
 	// Create repository instance
 	repo := codebase.NewGitHubCodebase(f.gitConfig)
 
-	// Create Bedrock dependencies
-	dataStore := storage.NewS3DataStore(f.awsConfig, config.S3BucketName, repo.GetPath())
-	storageImpl := storage.NewRDSPostgresStorage(f.awsConfig, "lambda-arn-placeholder") // TODO: Add Lambda ARN to config
-	ragImpl := rag.NewBedrockRAG(f.awsConfig, repo.GetPath(), config.KnowledgeBaseServiceRoleARN, config.RDSPostgres)
-
-	// Create Bedrock RAG builder
-	ragBuilder := builder.NewBedrockRAGBuilder(
-		repo.GetPath(),
-		dataStore,
-		storageImpl,
-		ragImpl,
-	)
-
-	// Create Bedrock agent builder
-	agentBuilder := builder.NewBedrockAgentBuilder(
-		f.awsConfig,
-		repo.GetPath(),
-		config.AgentServiceRoleARN,
-	)
+	// Create Bedrock builders
+	ragBuilder, agentBuilder := f.newBedrockBuilders(repo.GetPath())
 
 	// Create and run workflow
 	wf, err := workflow.NewCreateBedrockSetupWorkflow(repo, ragBuilder, agentBuilder)
@@ -176,6 +164,28 @@ func (f *DefaultAIInfrastructureFactory) createBedrockInfrastructure(ctx context
 	}, nil
 }
 
+// newBedrockBuilders wires the Bedrock RAG and agent builders for a repository path
+func (f *DefaultAIInfrastructureFactory) newBedrockBuilders(repoPath string) (builder.RAGBuilder, builder.AgentBuilder) {
+	config := f.aiConfig.Bedrock
+
+	dataStore := storage.NewS3DataStore(f.awsConfig, config.S3BucketName, repoPath)
+	ragImpl := rag.NewBedrockRAG(f.awsConfig, repoPath, config.KnowledgeBaseServiceRoleARN, config.RDSPostgres)
+
+	ragBuilder := builder.NewBedrockRAGBuilder(repoPath, dataStore, f.getSchemaStorage(), ragImpl)
+	agentBuilder := builder.NewBedrockAgentBuilder(f.awsConfig, repoPath, config.AgentServiceRoleARN)
+
+	return ragBuilder, agentBuilder
+}
+
+// getSchemaStorage returns the shared RDS schema storage, creating it on first use.
+// Only the Bedrock path needs it, so local mode never builds a Lambda client.
+func (f *DefaultAIInfrastructureFactory) getSchemaStorage() storage.Storage {
+	f.schemaStorageOnce.Do(func() {
+		f.schemaStorage = storage.NewRDSPostgresStorage(f.awsConfig, f.aiConfig.Bedrock.RDSPostgres.SchemaEnsureLambdaARN)
+	})
+	return f.schemaStorage
+}
+
 // createLocalInfrastructure creates local Ollama + ChromaDB infrastructure
 func (f *DefaultAIInfrastructureFactory) createLocalInfrastructure(ctx context.Context) (*AIInfrastructureResult, error) {
 	config := f.aiConfig.Local
@@ -265,19 +275,11 @@ func (f *DefaultAIInfrastructureFactory) determineProviderFromID(infrastructureI
 
 // teardownBedrockInfrastructure tears down Bedrock-specific infrastructure
 func (f *DefaultAIInfrastructureFactory) teardownBedrockInfrastructure(ctx context.Context, infrastructureID string) error {
-	config := f.aiConfig.Bedrock
-
 	// Create repository instance (needed for cleanup)
 	repo := codebase.NewGitHubCodebase(f.gitConfig)
 
-	// Create Bedrock dependencies for teardown
-	dataStore := storage.NewS3DataStore(f.awsConfig, config.S3BucketName, repo.GetPath())
-	storageImpl := storage.NewRDSPostgresStorage(f.awsConfig, "lambda-arn-placeholder")
-	ragImpl := rag.NewBedrockRAG(f.awsConfig, repo.GetPath(), config.KnowledgeBaseServiceRoleARN, config.RDSPostgres)
-
 	// Create Bedrock builders for teardown
-	ragBuilder := builder.NewBedrockRAGBuilder(repo.GetPath(), dataStore, storageImpl, ragImpl)
-	agentBuilder := builder.NewBedrockAgentBuilder(f.awsConfig, repo.GetPath(), config.AgentServiceRoleARN)
+	ragBuilder, agentBuilder := f.newBedrockBuilders(repo.GetPath())
 
 	// Create teardown workflow with resource IDs
 	// In a real implementation, these IDs would come from stored metadata
@@ -5,7 +5,7 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
-	"log"
+	"log/slog"
 
 	"github.com/kazemisoroush/code-refactoring-tool/pkg/ai/agent"
 	analyzerModels "github.com/kazemisoroush/code-refactoring-tool/pkg/analyzer/models"
@@ -34,14 +34,14 @@ func (a *AIPlanner) Plan(ctx context.Context, _ string, issues []analyzerModels.
 	if err != nil {
 		return models.Plan{}, fmt.Errorf("failed to create prompt: %w", err)
 	}
-	log.Printf("prompt: %s", prompt)
+	slog.Debug("Planner prompt", "prompt", prompt)
 
 	// send prompt to Bedrock
 	responseString, err := a.agent.Ask(ctx, prompt)
 	if err != nil {
 		return models.Plan{}, fmt.Errorf("failed to ask agent: %w", err)
 	}
-	log.Printf("response: %s", responseString)
+	slog.Debug("Planner response", "response", responseString)
 
 	// Parse response to Plan
 	var plan models.Plan